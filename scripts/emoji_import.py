@@ -26,10 +26,14 @@ Examples:
     python scripts/emoji_import.py noto-emoji ../icons/noto-emoji-main/png/128 --dest 128x128
 """
 
+import functools
+import mmap
 import os
 import re
 import shutil
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -37,39 +41,55 @@ _SCRIPT_DIR = Path(__file__).parent
 _PROJECT_DIR = _SCRIPT_DIR.parent
 
 
+# One pass over emoji-test.txt: group headers or data-line codepoint columns.
+# Matched as bytes so the emoji glyphs in the comments are never decoded.
+_EMOJI_TEST_RE = re.compile(
+    rb"^# group:[ \t]*(.+?)[ \t]*\r?$|^([0-9A-Fa-f ]+?)[ \t]*;", re.M)
+
+# Supported filename stems, one named group per format
+_FILENAME_RE = re.compile(
+    r"^(?:emoji_u(?P<noto>[0-9a-f]+(?:_[0-9a-f]+)*)"
+    r"|(?P<alt>u[0-9a-f]+(?:[-_]u?[0-9a-f]+)*)"
+    r"|(?P<twemoji>[0-9a-f]+(?:-[0-9a-f]+)*))$", re.I)
+
+# Separators in the Noto alt format (u1f645-u200d_...)
+_SPLIT_RE = re.compile(r"[-_]")
+
+# VARIATION SELECTOR-16 (emoji presentation)
+_FE0F = 0xFE0F
+
+
 def parse_emoji_test(filepath):
-    """Parse emoji-test.txt, return dict mapping codepoint tuple -> group name.
+    """Parse emoji-test.txt into codepoint tuple -> group name lookups.
 
     Handles all qualification levels (fully-qualified, minimally-qualified,
-    unqualified, component). Keys are tuples of uppercase hex strings.
+    unqualified, component). Keys are tuples of int codepoints.
+
+    Returns:
+        (mapping, mapping_no_vs) where mapping_no_vs is keyed by the same
+        sequences with every FE0F (variation selector) removed.
     """
     mapping = {}
+    mapping_no_vs = {}
     current_group = None
 
-    with open(filepath) as f:
-        for line in f:
-            line = line.strip()
-
-            # Track current group
-            if line.startswith("# group:"):
-                current_group = line.split(":", 1)[1].strip()
-                continue
-
-            # Skip comments and blanks
-            if not line or line.startswith("#"):
-                continue
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return mapping, mapping_no_vs
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            matches = _EMOJI_TEST_RE.findall(mm)
 
-            # Parse: "1F600 ; fully-qualified # 😀 E1.0 grinning face"
-            if ";" not in line:
-                continue
+    # Data lines look like: "1F600 ; fully-qualified # 😀 E1.0 grinning face"
+    for group, codepoints_str in matches:
+        if group:
+            current_group = group.decode("utf-8")
+        elif current_group:
+            codepoints = tuple(int(cp, 16) for cp in codepoints_str.split())
+            mapping.setdefault(codepoints, current_group)
+            without_fe0f = tuple(cp for cp in codepoints if cp != _FE0F)
+            mapping_no_vs.setdefault(without_fe0f, current_group)
 
-            codepoints_str = line.split(";")[0].strip()
-            codepoints = tuple(cp.upper() for cp in codepoints_str.split())
-
-            if current_group and codepoints not in mapping:
-                mapping[codepoints] = current_group
-
-    return mapping
+    return mapping, mapping_no_vs
 
 
 def parse_contexts(filepath):
@@ -87,55 +107,54 @@ def parse_contexts(filepath):
     return group_to_context
 
 
-def decode_filename(filename):
-    """Extract codepoint tuple from emoji filename. Auto-detects format.
-
-    Noto:    emoji_u1f600_1f3fd.svg -> ('1F600', '1F3FD')
-    Twemoji: 1f600-1f3fd.svg       -> ('1F600', '1F3FD')
-    Noto alt: u1f645.png            -> ('1F645',)
-    """
-    stem = Path(filename).stem
+def format_codepoints(codepoints):
+    """Format an int codepoint tuple as space-separated uppercase hex."""
+    return " ".join(f"{cp:04X}" for cp in codepoints)
 
-    # Noto format: emoji_u{hex}_{hex}...
-    if stem.startswith("emoji_u"):
-        parts = stem[len("emoji_u"):].split("_")
-        return tuple(p.upper() for p in parts)
 
-    # Noto alt format: u{hex}-u{hex}...
-    if stem.startswith("u") and not stem.startswith("un"):
-        # Split on -u or _ separators
-        parts = re.split(r'[-_]', stem)
-        return tuple(p.lstrip("u").upper() for p in parts)
-
-    # Twemoji format: {hex}-{hex}...
-    parts = stem.split("-")
-    return tuple(p.upper() for p in parts)
+@functools.lru_cache(maxsize=8192)
+def decode_filename(filename):
+    """Extract codepoint tuple from emoji filename. Auto-detects format.
 
+    Noto:    emoji_u1f600_1f3fd.svg -> (0x1F600, 0x1F3FD)
+    Twemoji: 1f600-1f3fd.svg       -> (0x1F600, 0x1F3FD)
+    Noto alt: u1f645.png            -> (0x1F645,)
 
-def lookup_group(codepoints, emoji_mapping):
+    Returns None if the name is not a sequence of hex codepoints.
+    """
+    m = _FILENAME_RE.match(Path(filename).stem)
+    if m is None:
+        return None
+
+    noto, alt, twemoji = m.group("noto", "alt", "twemoji")
+    if noto:
+        # Noto format: emoji_u{hex}_{hex}...
+        parts = noto.split("_")
+    elif alt:
+        # Noto alt format: u{hex}-u{hex}... (split on -u or _ separators)
+        parts = [p.lstrip("uU") for p in _SPLIT_RE.split(alt)]
+    else:
+        # Twemoji format: {hex}-{hex}...
+        parts = twemoji.split("-")
+    return tuple(int(p, 16) for p in parts)
+
+
+def lookup_group(codepoints, emoji_mapping, mapping_no_vs):
     """Look up group for codepoints, trying with and without FE0F."""
     # Direct lookup
-    if codepoints in emoji_mapping:
-        return emoji_mapping[codepoints]
+    group = emoji_mapping.get(codepoints)
+    if group is not None:
+        return group
 
     # Try adding FE0F after base codepoint (common for single-char emoji)
-    if len(codepoints) == 1:
-        with_vs = codepoints + ("FE0F",)
-        if with_vs in emoji_mapping:
-            return emoji_mapping[with_vs]
-
-    # Try removing all FE0F (variation selectors)
-    without_fe0f = tuple(cp for cp in codepoints if cp != "FE0F")
-    if without_fe0f != codepoints and without_fe0f in emoji_mapping:
-        return emoji_mapping[without_fe0f]
-
-    # Try inserting FE0F after first codepoint
-    if len(codepoints) >= 2 and "FE0F" not in codepoints:
-        with_vs = (codepoints[0], "FE0F") + codepoints[1:]
-        if with_vs in emoji_mapping:
-            return emoji_mapping[with_vs]
+    group = emoji_mapping.get(codepoints + (_FE0F,))
+    if group is not None:
+        return group
 
-    return None
+    # Ignore variation selectors on both sides
+    if _FE0F in codepoints:
+        codepoints = tuple(cp for cp in codepoints if cp != _FE0F)
+    return mapping_no_vs.get(codepoints)
 
 
 def main():
@@ -170,22 +189,25 @@ def main():
 
     # Parse reference data
     print(f"Parsing {emoji_test_path.name}...")
-    emoji_mapping = parse_emoji_test(emoji_test_path)
+    emoji_mapping, mapping_no_vs = parse_emoji_test(emoji_test_path)
     print(f"  {len(emoji_mapping)} codepoint sequences loaded")
 
     group_to_context = parse_contexts(contexts_path)
     print(f"  {len(group_to_context)} context mappings loaded")
 
     # Collect source files
-    source_files = sorted([
-        f for f in source_dir.iterdir()
-        if f.is_file() and f.suffix.lower() in (".svg", ".svgz", ".png")
-    ])
+    with os.scandir(source_dir) as it:
+        source_files = sorted(
+            (entry for entry in it
+             if entry.is_file()
+             and os.path.splitext(entry.name)[1].lower() in (".svg", ".svgz", ".png")),
+            key=lambda entry: entry.name)
     print(f"  {len(source_files)} source files found in {source_dir}")
 
     # Auto-detect dest if not specified
     if dest_subdir is None:
-        ext = source_files[0].suffix.lower() if source_files else ".svg"
+        ext = (os.path.splitext(source_files[0].name)[1].lower()
+               if source_files else ".svg")
         if ext in (".svg", ".svgz"):
             dest_subdir = "scalable"
         else:
@@ -200,11 +222,15 @@ def main():
     # Process files
     copied = 0
     unmapped = []
-    context_counts = {}
+    context_counts = Counter()
+    copy_jobs = []  # (src_path, dest_path)
 
     for src_file in source_files:
         codepoints = decode_filename(src_file.name)
-        group = lookup_group(codepoints, emoji_mapping)
+        if codepoints is None:
+            unmapped.append((src_file.name, None))
+            continue
+        group = lookup_group(codepoints, emoji_mapping, mapping_no_vs)
 
         if group is None:
             unmapped.append((src_file.name, codepoints))
@@ -215,15 +241,18 @@ def main():
             unmapped.append((src_file.name, codepoints))
             continue
 
-        # Ensure dest context directory exists
-        dest_dir = dest_base / context_id
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        copy_jobs.append((src_file.path, dest_base / context_id / src_file.name))
+        context_counts[context_id] += 1
+
+    # Ensure each dest context directory exists (once per context, not per file)
+    for context_id in context_counts:
+        (dest_base / context_id).mkdir(parents=True, exist_ok=True)
 
-        # Copy file
-        dest_file = dest_dir / src_file.name
-        shutil.copy2(src_file, dest_file)
-        copied += 1
-        context_counts[context_id] = context_counts.get(context_id, 0) + 1
+    # Copy files (I/O bound, so threads overlap the syscall latency)
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(lambda job: shutil.copy2(*job), copy_jobs):
+            copied += 1
 
     # Report
     print(f"Copied: {copied}")
@@ -233,7 +262,8 @@ def main():
     if unmapped:
         print(f"\nUnmapped: {len(unmapped)}")
         for name, cps in unmapped[:20]:
-            print(f"  {name}  ({' '.join(cps)})")
+            cps_str = format_codepoints(cps) if cps else "not a codepoint name"
+            print(f"  {name}  ({cps_str})")
         if len(unmapped) > 20:
             print(f"  ... and {len(unmapped) - 20} more")
 
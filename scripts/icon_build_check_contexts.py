@@ -17,17 +17,20 @@ Usage:
     python scripts/icon_build_check_contexts.py <theme>
 """
 
-import json
 import os
 import sys
 
 from icon_theme_processor import ThemeCatalog, save_json_compact_arrays, usage_error
 
 
-# Default overrides applied after lowercase conversion.
+# Default overrides applied after lowercase conversion. With a single
+# entry, build_contexts_from_index tests it directly rather than calling
+# .get() per directory; the unpacking below fails once a second entry is
+# added, as a reminder to go back to the dict lookup.
 _DEFAULT_CONTEXT_IDS = {
     "applications": "apps",
 }
+(_OVERRIDE_FROM, _OVERRIDE_TO), = _DEFAULT_CONTEXT_IDS.items()
 
 
 def build_contexts_from_index(theme_index_dir_map):
@@ -45,8 +48,8 @@ def build_contexts_from_index(theme_index_dir_map):
         if xdg_context is None:
             continue
         internal_context_id = xdg_context.lower()
-        internal_context_id = _DEFAULT_CONTEXT_IDS.get(
-            internal_context_id, internal_context_id)
+        if internal_context_id == _OVERRIDE_FROM:
+            internal_context_id = _OVERRIDE_TO
         if internal_context_id not in contexts:
             contexts[internal_context_id] = {
                 "xdg_context": xdg_context,
@@ -74,16 +77,18 @@ def main():
         keys = ", ".join(contexts.keys())
         print(f"  {theme.theme_id}: created contexts.json ({len(contexts)} contexts: {keys})")
     else:
-        # Compare existing with generated from index
-        existing_context_ids = set(existing.keys())
-        generated_context_ids = set(contexts.keys())
-
-        in_json_not_theme_index = existing_context_ids - generated_context_ids
-        in_theme_index_not_json = generated_context_ids - existing_context_ids
+        # Compare existing with generated from index. contexts is already
+        # sorted by build_contexts_from_index; contexts.json may be hand-edited.
+        in_json_not_theme_index = sorted(
+            context_id for context_id in existing if context_id not in contexts)
+        in_theme_index_not_json = [
+            context_id for context_id in contexts if context_id not in existing]
 
         # Check for xdg_context value changes on shared context_ids
         xdg_changed = []
-        for context_id in sorted(existing_context_ids & generated_context_ids):
+        for context_id in contexts:
+            if context_id not in existing:
+                continue
             old_xdg = existing[context_id].get("xdg_context")
             new_xdg = contexts[context_id].get("xdg_context")
             if old_xdg != new_xdg:
@@ -96,12 +101,12 @@ def main():
             print(f"  {theme.theme_id}: DIFFERENCES FOUND")
 
             if in_theme_index_not_json:
-                for context_id in sorted(in_theme_index_not_json):
+                for context_id in in_theme_index_not_json:
                     xdg = contexts[context_id]["xdg_context"]
                     print(f"    IN THEME-INDEX, NOT IN JSON: {context_id} (xdg_context={xdg})")
 
             if in_json_not_theme_index:
-                for context_id in sorted(in_json_not_theme_index):
+                for context_id in in_json_not_theme_index:
                     xdg = existing[context_id].get("xdg_context", "?")
                     print(f"    IN JSON, NOT IN THEME-INDEX: {context_id} (xdg_context={xdg})")
 
@@ -113,7 +118,7 @@ def main():
 
         # Validate icons.json icon contexts
         if os.path.isfile(theme.icons_path):
-            valid_contexts = existing_context_ids
+            valid_contexts = existing
             metadata = theme.icons_data
             icons = metadata.get("icons", {})
             missing_context = []
@@ -146,8 +151,7 @@ def main():
     # Update xdg_contexts in catalog
     xdg_set = {ctx_info["xdg_context"] for ctx_info in contexts.values()}
     catalog_path = catalog.catalog_path()
-    with open(catalog_path) as f:
-        catalog_data = json.load(f)
+    catalog_data = catalog.data
 
     new_list = sorted(xdg_set)
     old_list = catalog_data[theme.theme_id].get("xdg_contexts", [])
@@ -24,8 +24,26 @@ Usage:
 
 import os
 import sys
+from collections import defaultdict
 
-from icon_theme_processor import ThemeCatalog, save_json_compact_arrays, usage_error
+from icon_theme_processor import (
+    ThemeCatalog, save_json_compact_arrays, usage_error, walk_files,
+)
+
+
+def index_files_by_name(top):
+    """Index every non-directory entry under top by bare filename.
+
+    Does not descend into symlinked directories. Entries are listed in
+    os.walk top-down order.
+
+    Returns:
+        dict filename -> list of (full_path, is_symlink)
+    """
+    name_index = defaultdict(list)
+    for entry in walk_files(top):
+        name_index[entry.name].append((entry.path, entry.is_symlink()))
+    return name_index
 
 
 def main():
@@ -67,8 +85,7 @@ def main():
                 "context": context,
             }
             if "symbolic" not in entry:
-                stem, _ = os.path.splitext(info["file"])
-                if stem.endswith("-symbolic"):
+                if info["file"].rpartition(".")[0].endswith("-symbolic"):
                     entry["symbolic"] = True
             icons[icon_id] = entry
         data = {
@@ -83,46 +100,39 @@ def main():
     existing = data.get("icons", {})
     print(f"  icons.json has {len(existing)} icons")
 
-    disk_ids = set(discovered.keys())
-    json_ids = set(existing.keys())
-
-    on_disk_not_json = sorted(disk_ids - json_ids)
-    in_json_not_disk = sorted(json_ids - disk_ids)
-
-    # Check size mismatches on shared icons
+    # One pass over discovered collects new icons, size mismatches and path
+    # conflicts; only the (usually short) result lists are sorted.
+    # Path conflicts are multiple files of the same extension at the same
+    # icon id + size. One file per extension type is permitted (e.g. one
+    # .svg + one .png is OK).
+    on_disk_not_json = []
     size_mismatches = []
-    for icon_id in sorted(disk_ids & json_ids):
-        disk_sizes = discovered[icon_id]["sizes"]
-        json_sizes = existing[icon_id].get("sizes", [])
-        if disk_sizes != json_sizes:
-            size_mismatches.append((icon_id, json_sizes, disk_sizes))
-
-    # Check path conflicts (multiple files of same extension at same icon id + size)
-    # One file per extension type is permitted (e.g. one .svg + one .png is OK).
-    from collections import Counter
-
-    def _has_type_conflict(paths):
-        exts = Counter(os.path.splitext(p)[1].lower() for p in paths)
-        return any(c > 1 for c in exts.values())
-
-    path_conflicts = []
-    for icon_id in sorted(discovered):
-        info = discovered[icon_id]
-        for size in info["sizes"]:
-            paths = info["paths"][size]
-            if len(paths) > 1 and _has_type_conflict(paths):
-                path_conflicts.append((icon_id, size, paths))
-                break
-    # Build full conflict info for reporting
     conflict_details = []
-    for icon_id, _, _ in path_conflicts:
-        info = discovered[icon_id]
+    for icon_id, info in discovered.items():
+        existing_info = existing.get(icon_id)
+        if existing_info is None:
+            on_disk_not_json.append(icon_id)
+        else:
+            disk_sizes = info["sizes"]
+            json_sizes = existing_info.get("sizes", [])
+            if disk_sizes != json_sizes:
+                size_mismatches.append((icon_id, json_sizes, disk_sizes))
+
         size_paths = {}
         for size in info["sizes"]:
             paths = info["paths"][size]
-            if len(paths) > 1 and _has_type_conflict(paths):
+            if len(paths) < 2:
+                continue
+            exts = {p.rpartition(".")[2].lower() for p in paths}
+            if len(exts) < len(paths):
                 size_paths[size] = paths
-        conflict_details.append((icon_id, size_paths))
+        if size_paths:
+            conflict_details.append((icon_id, size_paths))
+    on_disk_not_json.sort()
+    size_mismatches.sort(key=lambda m: m[0])
+    conflict_details.sort(key=lambda c: c[0])
+
+    in_json_not_disk = sorted(k for k in existing if k not in discovered)
 
     # Report
     print(f"\nINDEXED ON DISK, NOT IN JSON: {len(on_disk_not_json)} icons")
@@ -137,32 +147,32 @@ def main():
 
     print(f"\nIN JSON, NOT-INDEXED OR SYMLINK-ONLY OR NOT-ON-DISK: {len(in_json_not_disk)} icons")
     if in_json_not_disk:
+        name_index = index_files_by_name(theme.dir)
         for icon_id in in_json_not_disk:
             info = existing[icon_id]
             fn = info.get('file', '?')
             files = []
-            for dirpath, dirnames, filenames in os.walk(theme.dir):
-                dirnames[:] = [d for d in dirnames
-                               if not os.path.islink(os.path.join(dirpath, d))]
-                if fn in filenames:
-                    full = os.path.join(dirpath, fn)
-                    rel = theme.strip_dir_base(full)
-                    is_link = os.path.islink(full)
-                    if is_link:
-                        raw_target = os.readlink(full)
-                        dir_part = os.path.dirname(rel)
-                        resolved = os.path.normpath(
-                            os.path.join(dir_part, raw_target))
-                        files.append(f"    {rel} -> {resolved}")
-                    else:
-                        files.append(f"    {rel} [REAL]")
-            has_real = any("[REAL]" in f for f in files)
+            any_real = any_link = False
+            for full, is_link in name_index.get(fn, ()):
+                rel = theme.strip_dir_base(full)
+                if is_link:
+                    any_link = True
+                    raw_target = os.readlink(full)
+                    dir_part = os.path.dirname(rel)
+                    resolved = os.path.normpath(
+                        os.path.join(dir_part, raw_target))
+                    files.append(f"    {rel} -> {resolved}")
+                else:
+                    any_real = True
+                    files.append(f"    {rel} [REAL]")
             if not files:
                 flag = "[NOT-ON-DISK]"
-            elif has_real:
+            elif any_real and any_link:
                 flag = "[MIXED]"
-            else:
+            elif any_link:
                 flag = "[100%-SYMLINKS]"
+            else:
+                flag = "[REAL-ONLY]"
             print(f"  {icon_id} {flag}")
             for f in files:
                 print(f)
@@ -224,8 +234,7 @@ def main():
             "sizes": info["sizes"],
             "context": context,
         }
-        stem, _ = os.path.splitext(info["file"])
-        if stem.endswith("-symbolic"):
+        if info["file"].rpartition(".")[0].endswith("-symbolic"):
             entry["symbolic"] = True
         existing[icon_id] = entry
         added += 1
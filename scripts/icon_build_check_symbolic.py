@@ -14,6 +14,7 @@ Usage:
 """
 
 import os
+import re
 import sys
 
 from icon_theme_processor import (
@@ -21,11 +22,15 @@ from icon_theme_processor import (
 )
 
 
-def is_symbolic_dir(dirpath, base):
-    """Check if a directory path is a symbolic directory."""
-    rel = os.path.relpath(dirpath, base)
-    parts = rel.split(os.sep)
-    return any(p == "symbolic" or p.startswith("symbolic-") for p in parts)
+# Icon filename: extension test (case-insensitive) plus a capture of a
+# "-symbolic" stem suffix, in one match per file
+_ICON_NAME_RE = re.compile(
+    r"(-symbolic)?\.(?i:%s)$" % "|".join(re.escape(ext[1:]) for ext in ICON_EXTENSIONS))
+
+
+def is_symbolic_dir_name(name):
+    """Check if a directory name marks a symbolic directory."""
+    return name == "symbolic" or name.startswith("symbolic-")
 
 
 def collect_symbolic_files(theme_dir):
@@ -36,29 +41,43 @@ def collect_symbolic_files(theme_dir):
     symbolic = set()
     base = theme_dir
 
-    for dirpath, dirnames, filenames in os.walk(base):
-        in_symbolic_dir = is_symbolic_dir(dirpath, base)
-
-        for fn in filenames:
-            stem, ext = os.path.splitext(fn)
-            if ext.lower() not in ICON_EXTENSIONS:
-                continue
-
-            full = os.path.join(dirpath, fn)
-
-            if in_symbolic_dir:
-                if os.path.islink(full):
-                    # Resolve symlink target, add its filename
-                    target = os.path.realpath(full)
-                    if os.path.isfile(target):
-                        symbolic.add(os.path.basename(target))
-                else:
+    # Same walk as os.walk (no descent into symlinked directories), but
+    # the per-entry type and symlink checks come from the scandir cache.
+    # Each stacked directory carries whether it is inside a symbolic dir.
+    stack = [(base, False)]
+    while stack:
+        dirpath, in_symbolic_dir = stack.pop()
+
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append((entry.path, in_symbolic_dir
+                                      or is_symbolic_dir_name(entry.name)))
+                    continue
+
+                fn = entry.name
+                m = _ICON_NAME_RE.search(fn)
+                if m is None:
+                    continue
+
+                if in_symbolic_dir:
+                    if entry.is_symlink():
+                        # Resolve symlink target, add its filename. One
+                        # readlink covers the usual single-hop link; chains
+                        # fall back to a full realpath.
+                        target = os.path.join(dirpath, os.readlink(entry.path))
+                        if os.path.islink(target):
+                            target = os.path.realpath(entry.path)
+                        if os.path.isfile(target):
+                            symbolic.add(os.path.basename(target))
+                    else:
+                        symbolic.add(fn)
+
+                # Anywhere: stem ends with -symbolic
+                if m.group(1):
                     symbolic.add(fn)
 
-            # Anywhere: stem ends with -symbolic
-            if stem.endswith("-symbolic"):
-                symbolic.add(fn)
-
     return symbolic
 
 
@@ -92,7 +111,7 @@ def main():
     updated = 0
     already_set = 0
     missing = 0
-    for fn in sorted(symbolic_files):
+    for fn in symbolic_files:
         if fn not in file_to_icons:
             missing += 1
             continue
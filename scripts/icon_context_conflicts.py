@@ -15,9 +15,9 @@ Examples:
     python scripts/icon_context_conflicts.py oxygen
 """
 
-import os
 import sys
-from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 
 from icon_theme_processor import ThemeCatalog, usage_error
 
@@ -35,43 +35,41 @@ def main():
     discovered = theme.scan_directory()
     print(f"Found {len(discovered)} unique icons", file=sys.stderr)
 
-    # Group by bare filename across contexts
-    # filename -> {context -> [relative_paths]}
-    file_contexts = defaultdict(lambda: defaultdict(list))
+    # Flat (filename, context, relative_path) rows, sorted so each
+    # filename's rows are contiguous
+    base_len = len(start_path) + 1  # scanned paths are start_path + "/" + rel
+    all_rows = []
     for icon_id, info in discovered.items():
         filename = info["file"]
         context = info["xdg_context"] or "(none)"
         for size in info["sizes"]:
             for path in info["paths"][size]:
-                rel = os.path.relpath(path, start_path)
-                file_contexts[filename][context].append(rel)
+                all_rows.append((filename, context, path[base_len:]))
+    all_rows.sort()
 
-    # Find filenames in 2+ contexts
-    conflicts = {fn: ctxs for fn, ctxs in file_contexts.items()
-                 if len(ctxs) >= 2}
-
-    if not conflicts:
+    # Keep filenames in 2+ contexts (rows within a filename are sorted by
+    # context, so that is when the first and last contexts differ)
+    rows = []
+    conflict_count = 0
+    for filename, group in groupby(all_rows, key=itemgetter(0)):
+        group = list(group)
+        if group[0][1] != group[-1][1]:
+            rows.extend(group)
+            conflict_count += 1
+
+    if not rows:
         print("No cross-context conflicts found.", file=sys.stderr)
         return
 
-    # Build flat rows: (filename, context, path)
-    rows = []
-    for filename, ctxs in conflicts.items():
-        for context, paths in ctxs.items():
-            for path in paths:
-                rows.append((filename, context, path))
-
-    rows.sort()
-
     print("=" * 70)
     print("CROSS-CONTEXT CONFLICTS (same filename in different contexts)")
     print("=" * 70)
     print()
 
-    for filename, context, path in rows:
-        print(f"{filename} {context} {path}")
+    sys.stdout.write("".join(f"{filename} {context} {path}\n"
+                             for filename, context, path in rows))
 
-    print(f"\n{len(conflicts)} filenames in multiple contexts, "
+    print(f"\n{conflict_count} filenames in multiple contexts, "
           f"{len(rows)} total entries", file=sys.stderr)
 
 
@@ -2,23 +2,38 @@
 """Find duplicate icon files by content hash, grouped by icon name.
 
 Usage:
-    python scripts/icon_duplicates.py <theme>
+    python scripts/icon_duplicates.py <theme> [--trust-catalog]
 
 Arguments:
     theme: Theme directory name (nuvola, oxygen, papirus, breeze)
+    --trust-catalog: Do not hash icons already marked with "duplicates" or
+        "duplicate_of" in icons.json; group them by their marked primary
+        instead. Faster for incremental runs, but unmarked icons that copy
+        a marked one are not detected.
 
 Reports icons where ALL sizes are duplicates first (full duplicates),
 then icons with partial duplicates.
 
+File hashes are cached per theme in $XDG_CACHE_HOME/icon-distillery/
+(default ~/.cache/icon-distillery/, SQLite) and reused while a file's
+mtime and size are unchanged. Delete the theme's .db file there to force
+a rehash.
+
 Examples:
     python scripts/icon_duplicates.py nuvola
     python scripts/icon_duplicates.py oxygen
+    python scripts/icon_duplicates.py papirus --trust-catalog
 """
 
+import contextlib
 import hashlib
+import io
+import mmap
 import os
+import sqlite3
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from icon_theme_processor import ThemeCatalog, usage_error
 
@@ -30,52 +45,223 @@ def load_catalog_marked(data):
         data: Parsed icons.json dict.
 
     Returns:
-        (has_duplicates, has_duplicate_of, refers_to_map, catalog_by_id)
+        (has_duplicates, has_duplicate_of, refers_to_map, dup_of_map,
+         dups_list_map) where the two maps are flat icon_id -> "duplicate_of"
+        value and icon_id -> "duplicates" list, holding only icons that
+        have the field.
     """
     icons = data.get("icons", {})
     has_duplicates = set()  # icons with "duplicates" array (primary icons)
     has_duplicate_of = set()  # icons with "duplicate_of" field
     refers_to_map = {}  # target_id -> list of referrer icon_ids
-    catalog_by_id = {}  # icon_id -> icon info dict
+    dup_of_map = {}  # icon_id -> duplicate_of target
+    dups_list_map = {}  # icon_id -> duplicates list
 
     for icon_id, info in icons.items():
-        catalog_by_id[icon_id] = info
-
         if "duplicates" in info:
             has_duplicates.add(icon_id)
+            dups_list_map[icon_id] = info["duplicates"]
         if "duplicate_of" in info:
             has_duplicate_of.add(icon_id)
             target = info["duplicate_of"]
+            dup_of_map[icon_id] = target
             if target not in refers_to_map:
                 refers_to_map[target] = []
             refers_to_map[target].append(icon_id)
 
-    return has_duplicates, has_duplicate_of, refers_to_map, catalog_by_id
+    return has_duplicates, has_duplicate_of, refers_to_map, dup_of_map, dups_list_map
+
+
+# Below this, mmap setup costs more than file_digest's buffered reads
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def _blake2b_128():
+    return hashlib.blake2b(digest_size=16)
 
 
 def hash_file(path):
-    """Return MD5 hash of file contents."""
+    """Return a 128-bit BLAKE2b hex digest of file contents.
+
+    Only used for content-equality grouping, so a fast non-MD5 digest is
+    fine; file_digest runs the read/update loop in C.
+    """
     with open(path, "rb") as f:
-        return hashlib.md5(f.read()).hexdigest()
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            return hashlib.file_digest(f, _blake2b_128).hexdigest()
+        # Large files: hash the mapped pages directly, no copy into Python
+        h = _blake2b_128()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            h.update(mm)
+        return h.hexdigest()
+
+
+def _hash_or_error(path):
+    """hash_file() for executor.map: returns the exception instead of raising.
+
+    Digests are interned: identical files then share one str object, so
+    the hash-keyed grouping compares by identity.
+    """
+    try:
+        return sys.intern(hash_file(path))
+    except Exception as e:
+        return e
+
+
+# Per-theme cache of file hashes, keyed by relative path and validated by
+# mtime + size. It lives in the user cache dir, never in the theme data,
+# in a file named after the theme dir and a digest of its absolute path
+# (so two checkouts do not share one). The table is named after the
+# digest so a hash change starts a fresh cache.
+_HASH_CACHE_TABLE = "blake2b_128"
+
+
+def hash_cache_path(theme_dir):
+    """Path of the theme's hash cache database in the user cache dir."""
+    theme_dir = os.path.abspath(theme_dir)
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    dir_digest = hashlib.blake2b(os.fsencode(theme_dir), digest_size=4).hexdigest()
+    return os.path.join(cache_root, "icon-distillery",
+                        f"{os.path.basename(theme_dir)}-{dir_digest}.db")
+
+
+def open_hash_cache(theme_dir):
+    """Open the theme's hash cache.
+
+    Returns:
+        (conn, cached) where cached maps rel_path -> (mtime_ns, size, hash),
+        or (None, {}) if the cache cannot be opened (e.g. no writable cache dir).
+    """
+    db_path = hash_cache_path(theme_dir)
+    try:
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        conn = sqlite3.connect(db_path)
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {_HASH_CACHE_TABLE} ("
+                     "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, hash TEXT)")
+        rows = conn.execute(
+            f"SELECT path, mtime_ns, size, hash FROM {_HASH_CACHE_TABLE}").fetchall()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Hash cache unavailable: {e}", file=sys.stderr)
+        return None, {}
+    return conn, {path: (mtime_ns, size, h) for path, mtime_ns, size, h in rows}
+
+
+def save_hash_cache(conn, rows, stale_paths=()):
+    """Upsert (rel_path, mtime_ns, size, hash) rows in one transaction and close.
+
+    Rows for stale_paths (files gone from the theme) are deleted in the
+    same transaction, so the cache does not outgrow the theme.
+    """
+    try:
+        with conn:
+            conn.executemany(
+                f"DELETE FROM {_HASH_CACHE_TABLE} WHERE path = ?",
+                ((path,) for path in stale_paths))
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {_HASH_CACHE_TABLE} VALUES (?, ?, ?, ?)", rows)
+    except sqlite3.Error as e:
+        print(f"Could not update hash cache: {e}", file=sys.stderr)
+    finally:
+        conn.close()
+
+
+@contextlib.contextmanager
+def buffered_stdout(buffer_size=1 << 20):
+    """Send sys.stdout through a large write buffer for the duration.
+
+    The report is thousands of short print() calls; this lets them reach
+    the OS in large blocks instead of one write per line. sys.stdout is
+    flushed and restored on exit, and left alone if it has no binary
+    buffer (e.g. a StringIO).
+    """
+    stdout = sys.stdout
+    raw = getattr(stdout, "buffer", None)
+    if raw is None:
+        yield
+        return
+    stdout.flush()
+    writer = io.BufferedWriter(raw, buffer_size=buffer_size)
+    text = io.TextIOWrapper(writer, encoding=stdout.encoding, errors=stdout.errors)
+    sys.stdout = text
+    try:
+        yield
+    finally:
+        sys.stdout = stdout
+        try:
+            text.flush()
+        finally:
+            # Detach so neither wrapper closes the real stdout when collected
+            text.detach()
+            writer.detach()
+
+
+def match_flags(own_mask, all_matches, full_dup_matches, size_mask):
+    """Compute partial-duplicate flags for one icon from size bitmasks.
+
+    Args:
+        own_mask: Bitmask of this icon's sizes.
+        all_matches: other_id -> bitmask of the OTHER icon's matched sizes.
+        full_dup_matches: Subset of all_matches for icons in full-dup groups.
+        size_mask: icon_id -> bitmask of that icon's sizes.
+
+    Returns:
+        (is_superset, all_sizes_match, is_largest_match)
+    """
+    own_count = own_mask.bit_count()
+    is_superset = False  # has more sizes AND matches all of other's sizes
+    all_sizes_match = False  # ALL of our sizes match another icon
+    is_largest_match = False  # matches at largest common size
+
+    # One pass over ALL matches; largest-match only looks at full-dup ones
+    for other_id, matched_mask in all_matches.items():
+        other_mask = size_mask[other_id]
+        # Superset: we have more sizes AND matched ALL of their sizes
+        if own_count > other_mask.bit_count() and matched_mask == other_mask:
+            is_superset = True
+        # All sizes match: ALL of our sizes match this other icon
+        if matched_mask.bit_count() == own_count:
+            all_sizes_match = True
+        # Largest match: match at largest common size with a full-dup icon
+        if not is_largest_match and other_id in full_dup_matches:
+            common_mask = own_mask & other_mask
+            if common_mask and matched_mask & (1 << (common_mask.bit_length() - 1)):
+                is_largest_match = True
+        if is_superset and all_sizes_match and is_largest_match:
+            break
+
+    return is_superset, all_sizes_match, is_largest_match
 
 
 def main():
+    with buffered_stdout():
+        find_duplicates()
+
+
+def find_duplicates():
     catalog = ThemeCatalog()
 
     if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
         catalog.print_available()
         usage_error(__doc__)
 
-    theme = catalog.get_theme(sys.argv[1])
+    theme_arg = None
+    trust_catalog = False
+    for arg in sys.argv[1:]:
+        if arg == "--trust-catalog":
+            trust_catalog = True
+        elif theme_arg is None:
+            theme_arg = arg
+        else:
+            usage_error(__doc__, f"Unknown argument '{arg}'")
+
+    theme = catalog.get_theme(theme_arg)
     start_path = theme.dir
 
     # Load metadata to see which icons are already marked
     data = theme.icons_data
-    has_duplicates, has_duplicate_of, refers_to_map, catalog_by_id = load_catalog_marked(data)
-
-    def get_dup_of(icon_id):
-        """Get duplicate_of value for icon, or None."""
-        return catalog_by_id.get(icon_id, {}).get("duplicate_of")
+    (has_duplicates, has_duplicate_of, refers_to_map,
+     dup_of_map, dups_list_map) = load_catalog_marked(data)
+    get_dup_of = dup_of_map.get  # duplicate_of value for icon, or None
 
     def print_dup_of(icon_id, indent="    "):
         """Print HAS duplicate_of line if icon has one. Returns the value."""
@@ -88,31 +274,104 @@ def main():
     discovered = theme.scan_directory()
     print(f"Found {len(discovered)} unique icons", file=sys.stderr)
 
-    # Build icon inventory with hashes: icon_id -> {size: {path, hash, file_size, files}}
+    # With --trust-catalog, files of already-marked icons get a pseudo-hash
+    # of their marked primary, size and extension instead of being read
+    # ("cat-" prefix so the report's 12-character hash column shows it)
+    file_hashes = {}
+    if trust_catalog:
+        for icon_id, info in discovered.items():
+            if icon_id not in has_duplicates and icon_id not in has_duplicate_of:
+                continue
+            primary = get_dup_of(icon_id) or icon_id
+            for size in info["sizes"]:
+                for p in info["paths"][size]:
+                    ext = os.path.splitext(p)[1].lower()
+                    key = f"{primary}:{size}{ext}".encode("utf-8")
+                    file_hashes[p] = "cat-" + hashlib.blake2b(key, digest_size=14).hexdigest()
+
+    all_paths = [p for info in discovered.values()
+                 for size in info["sizes"] for p in info["paths"][size]
+                 if p not in file_hashes]
+
+    # A file whose byte length no other file shares cannot be a duplicate:
+    # key it by its length instead of hashing it (unique among such files)
+    file_stats = {}
+    for p in all_paths:
+        try:
+            file_stats[p] = os.stat(p)
+        except OSError:
+            pass  # hash_file() reports the error below
+    length_counts = Counter(st.st_size for st in file_stats.values())
+    to_hash = {}  # path -> (st_dev, st_ino), or the path if stat failed
+    for p in all_paths:
+        st = file_stats.get(p)
+        if st is None:
+            to_hash[p] = p
+        elif length_counts[st.st_size] == 1:
+            file_hashes[p] = f"size:{st.st_size:07x}"
+        else:
+            to_hash[p] = (st.st_dev, st.st_ino)
+
+    # Hash the rest once per inode (hardlinked copies share one read),
+    # reusing cached hashes for files unchanged since the last run
+    base_len = len(start_path) + 1  # scanned paths are start_path + "/" + rel
+    cache_conn, cached = open_hash_cache(start_path)
+    inode_hashes = {}
+    inode_paths = {}
+    for p, key in to_hash.items():
+        if key in inode_hashes or key in inode_paths:
+            continue
+        st = file_stats.get(p)
+        entry = cached.get(p[base_len:])
+        if st is not None and entry and entry[:2] == (st.st_mtime_ns, st.st_size):
+            inode_hashes[key] = sys.intern(entry[2])
+        else:
+            inode_paths[key] = p
+
+    # In parallel (file I/O and hashing release the GIL)
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        new_hashes = dict(zip(inode_paths, executor.map(_hash_or_error,
+                                                        inode_paths.values())))
+    inode_hashes.update(new_hashes)
+    for p, key in to_hash.items():
+        file_hashes[p] = inode_hashes[key]
+
+    if cache_conn is not None:
+        cache_rows = []
+        for key, p in inode_paths.items():
+            h = new_hashes[key]
+            st = file_stats.get(p)
+            if st is not None and not isinstance(h, Exception):
+                cache_rows.append((p[base_len:], st.st_mtime_ns, st.st_size, h))
+        # Every scanned file counts as seen, including --trust-catalog ones
+        # that were not hashed this run, so their cached hashes survive
+        seen = {p[base_len:] for info in discovered.values()
+                for paths in info["paths"].values() for p in paths}
+        save_hash_cache(cache_conn, cache_rows, cached.keys() - seen)
+
+    # Build icon inventory with hashes: icon_id -> {size: {hash, files}}
+    # Only what the analysis and report read is kept per size. Sizes are
+    # inserted in ascending order (info["sizes"] is sorted), so list(size_data)
+    # is already the sorted size list.
     icons = defaultdict(dict)
     for icon_id, info in discovered.items():
         for size in info["sizes"]:
             paths = sorted(info["paths"][size],
                            key=lambda p: os.path.splitext(p)[1].lower())
             path = paths[0]
-            try:
-                h = hash_file(path)
-                rel_path = os.path.relpath(path, start_path)
-                files = []
-                for p in paths:
-                    try:
-                        files.append((hash_file(p)[:12],
-                                      os.path.relpath(p, start_path)))
-                    except Exception:
-                        pass
-                icons[icon_id][size] = {
-                    "path": rel_path,
-                    "hash": h,
-                    "file_size": os.path.getsize(path),
-                    "files": files,
-                }
-            except Exception as e:
-                print(f"Error hashing {path}: {e}", file=sys.stderr)
+            h = file_hashes[path]
+            if isinstance(h, Exception):
+                print(f"Error hashing {path}: {h}", file=sys.stderr)
+                continue
+            files = []
+            for p in paths:
+                fh = file_hashes[p]
+                if not isinstance(fh, Exception):
+                    files.append((fh[:12], p[base_len:]))
+            icons[icon_id][size] = {
+                "hash": h,
+                "files": files,
+            }
 
     # Map every file hash to the set of icons that have it (for per-file labeling)
     file_hash_icons = defaultdict(set)
@@ -121,19 +380,13 @@ def main():
             for fh, fp in d["files"]:
                 file_hash_icons[fh].add(icon_id)
 
-    # Build hash signature for each icon (sorted tuple of (size, hash) pairs)
-    # This lets us compare if two icons have identical content at all sizes
-    icon_signatures = {}  # icon_id -> signature (frozenset of hashes)
-    for icon_id, size_data in icons.items():
-        # Signature is just the set of hashes (size-independent)
-        hashes = frozenset(d["hash"] for d in size_data.values())
-        icon_signatures[icon_id] = hashes
-
-    # Group icons by their hash sets to find full duplicates
-    # Full duplicate = icons that have the exact same set of hashes
+    # Group icons by their hash signature to find full duplicates: the
+    # signature is the set of hashes (size-independent), so full duplicate =
+    # icons that have the exact same set of hashes. frozenset hashing only
+    # combines the (cached) hashes of the interned digests.
     sig_to_icons = defaultdict(list)
-    for icon_id, sig in icon_signatures.items():
-        sig_to_icons[sig].append(icon_id)
+    for icon_id, size_data in icons.items():
+        sig_to_icons[frozenset(d["hash"] for d in size_data.values())].append(icon_id)
 
     # Find groups where all sizes match between icons
     full_dup_groups = []  # [(icon_ids, sizes_info)]
@@ -154,13 +407,14 @@ def main():
     hash_to_occurrences = defaultdict(list)
     for icon_id, size_data in icons.items():
         for size, d in size_data.items():
-            hash_to_occurrences[d["hash"]].append((icon_id, size, d["path"]))
+            hash_to_occurrences[d["hash"]].append((icon_id, size))
 
     # Find hashes that appear in multiple icons (partial dups)
-    partial_dups = defaultdict(list)  # hash -> [(icon_id, size, path)]
+    # Paths stay in icons[icon_id][size]; the index only needs (icon_id, size)
+    partial_dups = {}  # hash -> [(icon_id, size)]
     for h, occurrences in hash_to_occurrences.items():
         # Get unique icon names for this hash
-        unique_icons = set(icon_id for icon_id, size, path in occurrences)
+        unique_icons = set(icon_id for icon_id, size in occurrences)
         if len(unique_icons) > 1:
             # This hash appears in multiple different icons
             partial_dups[h] = occurrences
@@ -251,7 +505,7 @@ def main():
                         print(f"        {ref_id}")
             for icon_id in sorted(group):
                 size_data = icons[icon_id]
-                sizes = sorted(size_data.keys())
+                sizes = list(size_data)
 
                 # Show marked status for each icon
                 if icon_id in has_duplicates:
@@ -273,8 +527,7 @@ def main():
 
             targets_outside = set()
             for icon_id in group:
-                icon_info = catalog_by_id.get(icon_id, {})
-                dup_of = icon_info.get("duplicate_of")
+                dup_of = get_dup_of(icon_id)
                 if dup_of and dup_of not in group:
                     targets_outside.add(dup_of)
             if targets_outside:
@@ -286,7 +539,7 @@ def main():
     # Find icons that have at least one size with a duplicate (excluding full dups)
     icons_with_partial_dups = set()
     for h, occurrences in partial_dups.items():
-        unique_icons = set(icon_id for icon_id, size, path in occurrences)
+        unique_icons = set(icon_id for icon_id, size in occurrences)
         # Only consider icons not already in full duplicate groups
         non_full_dup_icons = unique_icons - in_full_dup
         if len(non_full_dup_icons) >= 1 and len(unique_icons) > 1:
@@ -298,73 +551,49 @@ def main():
         print("=" * 70)
         print()
 
-        # Build reverse lookup: hash -> list of (icon_id, size) for duplicates
-        hash_to_other_icons = defaultdict(list)
-        for h, occurrences in partial_dups.items():
-            for icon_id, size, path in occurrences:
-                hash_to_other_icons[h].append((icon_id, size))
-
-        # Sort icons by number of duplicate matches, then by name
-        def count_dup_matches(icon_id):
-            count = 0
-            for size, d in icons[icon_id].items():
-                others = [n for n, s in hash_to_other_icons.get(d["hash"], []) if n != icon_id]
-                count += len(others)
-            return count
+        # Sort icons by number of duplicate matches, then by name. Each of an
+        # icon's own sizes with hash h is one entry in partial_dups[h], so the
+        # matches from other icons are len(partial_dups[h]) - own count.
+        match_count = {}
+        for icon_id in icons_with_partial_dups:
+            own_hashes = Counter(d["hash"] for d in icons[icon_id].values())
+            match_count[icon_id] = sum(
+                n * (len(partial_dups[h]) - n)
+                for h, n in own_hashes.items() if h in partial_dups)
 
         sorted_icons = sorted(icons_with_partial_dups,
-                              key=lambda n: (-count_dup_matches(n), n))
+                              key=lambda n: (-match_count[n], n))
+
+        # Size sets as int bitmasks (bits in ascending size order): set
+        # equality is ==, intersection is &, and set size is bit_count()
+        size_bit = {size: 1 << i for i, size in enumerate(
+            sorted({size for size_data in icons.values() for size in size_data}))}
+        size_mask = {icon_id: sum(size_bit[size] for size in size_data)
+                     for icon_id, size_data in icons.items()}
 
         for icon_id in sorted_icons:
             size_data = icons[icon_id]
-            sizes = sorted(size_data.keys())
+            sizes = list(size_data)
+            own_mask = size_mask[icon_id]
+            own_count = len(size_data)
 
             # Collect ALL matching icons - track OTHER icon's matched sizes
-            all_matches = {}  # other_name -> set of OTHER's sizes that matched
+            all_matches = {}  # other_name -> mask of OTHER's sizes that matched
             for size, d in size_data.items():
-                for other_name, other_size in hash_to_other_icons.get(d["hash"], []):
+                for other_name, other_size in partial_dups.get(d["hash"], []):
                     if other_name != icon_id:
-                        if other_name not in all_matches:
-                            all_matches[other_name] = set()
-                        all_matches[other_name].add(other_size)  # Track THEIR size
+                        # Track THEIR size
+                        all_matches[other_name] = (all_matches.get(other_name, 0)
+                                                   | size_bit[other_size])
 
             # Separate full-dup matches
             full_dup_matches = {k: v for k, v in all_matches.items() if k in in_full_dup}
 
-            # Check if ALL sizes match a single other icon
-            all_sizes_match_icon = None
-            for other_name, match_sizes in all_matches.items():
-                if match_sizes == set(sizes):
-                    all_sizes_match_icon = other_name
-                    break
-
             # Determine flags
-            is_superset = False  # has more sizes AND matches all of other's sizes
-            all_sizes_match = False  # ALL of our sizes match another icon
-            all_sizes_match_icons = []  # icons where all our sizes match
-            is_largest_match = False  # matches at largest common size
+            is_superset, all_sizes_match, is_largest_match = match_flags(
+                own_mask, all_matches, full_dup_matches, size_mask)
             has_multiple_full_dups = len(full_dup_matches) >= 2
 
-            # Check superset and all-sizes-match against ALL matches
-            for other_name, matched_other_sizes in all_matches.items():
-                other_all_sizes = set(icons[other_name].keys())
-                # Superset: we have more sizes AND matched ALL of their sizes
-                if len(size_data) > len(other_all_sizes) and matched_other_sizes == other_all_sizes:
-                    is_superset = True
-                # All sizes match: ALL of our sizes match this other icon
-                if len(matched_other_sizes) == len(size_data):
-                    all_sizes_match = True
-                    all_sizes_match_icons.append(other_name)
-
-            for other_name, matched_other_sizes in full_dup_matches.items():
-                # Check largest match: match at largest common size
-                other_sizes = set(icons[other_name].keys())
-                common_sizes = set(sizes) & other_sizes
-                if common_sizes:
-                    largest_common = max(common_sizes)
-                    if largest_common in matched_other_sizes:
-                        is_largest_match = True
-
             # Check if any matching full-dup icon has referrers (exclude self)
             referrer_info = []
             for other_id in full_dup_matches:
@@ -387,7 +616,6 @@ def main():
             if has_referrers:
                 flags.append("[DUPLICATE_OF REFERRERS]")
             # Check catalog for duplicate_of and duplicates
-            icon_info = catalog_by_id.get(icon_id, {})
             icon_dup_of = get_dup_of(icon_id)
             if icon_dup_of:
                 flags.append("[DONE-DUPLICATE-OF]")
@@ -395,14 +623,14 @@ def main():
             # Check if this icon is [DONE] as PRIMARY
             # Requirements: has duplicates list, all listed have duplicate_of pointing here,
             # and all hash-matched icons are in the list
-            icon_dups = icon_info.get("duplicates", [])
+            icon_dups = dups_list_map.get(icon_id, [])
             is_done_primary = False
             if icon_dups:
                 # Get all icons that match ALL our sizes (candidates for duplicates)
                 expected_dups = set()
-                for other_id, matched_sizes in all_matches.items():
+                for other_id, matched_mask in all_matches.items():
                     # If other icon matches at ALL of our sizes, it should be a duplicate
-                    if len(matched_sizes) == len(sizes):
+                    if matched_mask.bit_count() == own_count:
                         expected_dups.add(other_id)
 
                 # Check 1: All listed duplicates have duplicate_of pointing to us
@@ -458,7 +686,7 @@ def main():
             for size in sizes:
                 d = size_data[size]
                 # Find other icons with same hash at this size
-                others = [(k, s) for k, s in hash_to_other_icons.get(d["hash"], [])
+                others = [(k, s) for k, s in partial_dups.get(d["hash"], [])
                           if k != icon_id]
 
                 if others:
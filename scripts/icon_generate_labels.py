@@ -26,11 +26,18 @@ Examples:
     python scripts/icon_generate_labels.py oxygen --simulate --replace '.' ' ' --replace '+' 'plus'
 """
 
+import functools
 import os
-import re
+import string
 import sys
 
-from icon_theme_processor import ThemeCatalog, save_json_compact_arrays, usage_error
+from icon_theme_processor import (
+    SEPARATORS_TO_SPACE, ThemeCatalog, save_json_compact_arrays, usage_error,
+)
+
+
+# The expected label characters
+_LABEL_CHARS = frozenset(string.ascii_letters + string.digits + ' ')
 
 
 def generate_label(filename, replacements=None):
@@ -45,21 +52,46 @@ def generate_label(filename, replacements=None):
     """
     stem = os.path.splitext(filename)[0]
     stem = stem.replace('c++', 'Cpp ')
-    stem = stem.replace('-', ' ').replace('_', ' ')
-    if replacements:
-        for old, new in replacements:
-            stem = stem.replace(old, new)
+    replacements = tuple(replacements or ())
+    table = _label_table(replacements)
+    if table is not None:
+        return stem.translate(table).title()
+    stem = stem.translate(SEPARATORS_TO_SPACE)
+    for old, new in replacements:
+        stem = stem.replace(old, new)
     return stem.title()
 
 
+@functools.lru_cache(maxsize=None)
+def _label_table(replacements):
+    """Fold -/_ -> space and the custom replacements into one translate table.
+
+    Each step maps characters independently when every OLD is a single
+    character, so the chain collapses to one table of each character's
+    final output. Returns None if any OLD is longer (or empty); the
+    replacements are then applied one by one.
+    """
+    if any(len(old) != 1 for old, new in replacements):
+        return None
+    table = {}
+    for ch in {'-', '_', *(old for old, new in replacements)}:
+        out = ch.translate(SEPARATORS_TO_SPACE)
+        for old, new in replacements:
+            out = out.replace(old, new)
+        table[ord(ch)] = out
+    return table
+
+
 def check_label(label):
     """Check if label has unexpected characters.
 
     Expected: a-z, A-Z, 0-9, and space.
     Returns list of unexpected characters found, or empty list if clean.
     """
-    unexpected = re.findall(r'[^a-zA-Z0-9 ]', label)
-    return list(set(unexpected))
+    # Fast path for the common clean label: ASCII letters/digits plus spaces
+    if label.isascii() and label.replace(' ', '').isalnum():
+        return []
+    return list(set(label) - _LABEL_CHARS)
 
 
 def main():
@@ -13,8 +13,13 @@ Requires: wxPython, cairosvg (for SVG rendering)
 import sys
 import os
 import io
+import bisect
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
+from operator import attrgetter
 
 # Add scripts dir to path for icon_theme_processor import
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -23,13 +28,14 @@ if str(SCRIPT_DIR) not in sys.path:
 
 # --- Dependency check ---
 try:
-    import cairosvg
+    from cairosvg.parser import Tree as SvgTree
+    from cairosvg.surface import PNGSurface
 except ImportError:
     print("ERROR: cairosvg is required for SVG icon rendering.")
     print("  Install: pip install cairosvg  or  sudo apt install python3-cairosvg")
     sys.exit(1)
 
-from icon_theme_processor import ThemeCatalog, ICON_EXTENSIONS
+from icon_theme_processor import ThemeCatalog, ICON_EXTENSIONS, SEPARATORS_TO_SPACE
 
 import wx
 
@@ -38,12 +44,23 @@ import wx
 # Data Layer
 # ============================================================================
 
+# Most decoded bitmaps kept in IconDataModel's cache (least recently used
+# are dropped first)
+BITMAP_CACHE_MAX = 4096
+
+# Most parsed SVG documents kept for re-rendering at other sizes
+SVG_TREE_CACHE_MAX = 512
+
+# Every IconEntry.status value
+_ALL_STATUSES = frozenset({"hinted", "duplicate", "pending"})
+
+
 def _theme_label(theme):
     """Get display label for a theme from its catalog config."""
     return theme.config.get("label", theme.theme_id.title())
 
 
-@dataclass
+@dataclass(slots=True)
 class IconEntry:
     id: str
     name: str = ""
@@ -52,9 +69,13 @@ class IconEntry:
     category: str = ""             # context (actions, places, etc.)
     status: str = "pending"       # hinted, duplicate, pending
     paths: dict = field(default_factory=dict)   # size -> path_str
+    max_size: int = 0              # largest size in paths, 0 if none
     duplicates: list = field(default_factory=list)
     duplicate_of: str = ""
     file: str = ""                 # bare filename from icons.json
+    search_text: str = ""          # lowercased fields matched by search
+    sort_name: str = ""            # lowercased name
+    default_sort: tuple = ()       # (theme_id, sort_name)
 
 
 class IconDataModel:
@@ -63,7 +84,14 @@ class IconDataModel:
     def __init__(self):
         self._catalog = ThemeCatalog()
         self._entries = {}          # (theme_id, icon_id) -> IconEntry
-        self._bitmap_cache = {}     # (entry_id, size) -> wx.Bitmap
+        self._by_theme = {}         # theme_id -> [IconEntry] in load order
+        self._bitmap_cache = OrderedDict()  # (path_str, size) -> wx.Bitmap, LRU
+        self._cache_generation = 0  # bumped by clear_cache
+        self._svg_pending = set()   # cache keys being rendered in the background
+        self._svg_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+        self.on_bitmaps_ready = None  # called (UI thread) with each landed cache key
+        self._svg_trees = OrderedDict()  # path_str -> (parsed SVG, render lock), LRU
+        self._svg_trees_lock = threading.Lock()
         self._discovered_sizes = set()
         self._loaded_themes = set()
         self._themes = {}           # theme_id -> Theme (cached)
@@ -109,29 +137,59 @@ class IconDataModel:
 
     def load_theme(self, theme_id):
         """Load all icons from a theme's icons.json and disk scan."""
-        if theme_id in self._loaded_themes:
+        self.load_themes([theme_id])
+
+    def load_themes(self, theme_ids):
+        """Load several themes, reading them in parallel.
+
+        Each theme's icons.json and file checks are I/O bound, so the
+        themes are read on worker threads; the results are merged into
+        the model here, in the order given.
+        """
+        pending = []
+        for theme_id in theme_ids:
+            if theme_id not in self._loaded_themes:
+                self._loaded_themes.add(theme_id)
+                pending.append(theme_id)
+        if not pending:
             return
-        self._loaded_themes.add(theme_id)
 
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            loaded = list(executor.map(self._read_theme, pending))
+
+        for theme_id, theme_entries in zip(pending, loaded):
+            if theme_entries is None:
+                continue
+            self._by_theme[theme_id] = theme_entries
+            for entry in theme_entries:
+                self._entries[(theme_id, entry.id)] = entry
+                self._discovered_sizes.update(entry.paths)
+
+    def _read_theme(self, theme_id):
+        """Build the IconEntry list for a theme, or None if it can't be read.
+
+        Touches no model state, so themes can be read concurrently.
+        """
         theme = self._themes.get(theme_id)
         if not theme or not os.path.isdir(theme.dir):
-            return
+            return None
         if not os.path.isfile(theme.icons_path):
             print(f"Warning: icons.json not found for {theme_id}, skipping")
-            return
+            return None
 
         # Load icons.json metadata
         try:
             icons_data = theme.icons_data
         except SystemExit:
-            return
+            return None
         icons = icons_data.get("icons", {})
+        theme_entries = []
 
         # Build IconEntry objects from icons.json, paths from theme library
         for icon_id, info in icons.items():
-            context = info.get("context", "")
+            # Interned: one shared string per context across all entries
+            context = sys.intern(info.get("context", ""))
             filename = info.get("file", "")
-            stem = Path(filename).stem
 
             # Status from icons.json fields
             if info.get("duplicate_of"):
@@ -144,97 +202,188 @@ class IconDataModel:
             # Paths from theme library (icons.json sizes + context_map)
             sizes = set(info.get("sizes", []))
             paths = theme.get_icon_paths_by_size(context, filename, sizes) if context and filename else {}
-            for size in paths:
-                self._discovered_sizes.add(size)
 
-            key = (theme_id, icon_id)
-            self._entries[key] = IconEntry(
+            # Label from icons.json, else derived from the filename stem
+            label = info.get("label")
+            if label is None:
+                label = os.path.splitext(filename)[0].translate(SEPARATORS_TO_SPACE).title()
+
+            entry = IconEntry(
                 id=icon_id,
-                name=info.get("label", stem.replace("-", " ").replace("_", " ").title()),
+                name=label,
                 hints=info.get("hints", []),
                 source=theme_id,
                 category=context,
                 status=status,
                 paths=paths,
+                max_size=max(paths) if paths else 0,
                 duplicates=info.get("duplicates", []),
                 duplicate_of=info.get("duplicate_of", ""),
                 file=filename,
             )
+            entry.search_text = (
+                f"{entry.name} {entry.id} {' '.join(entry.hints)} "
+                f"{entry.source} {entry.category}"
+            ).lower()
+            entry.sort_name = entry.name.lower()
+            entry.default_sort = (theme_id, entry.sort_name)
+            theme_entries.append(entry)
+        return theme_entries
 
     def get_filtered(self, query="", themes=None, show_hinted=True,
                      show_duplicates=True, show_unhinted=True,
-                     min_size=None, sort_key=None):
-        """Return filtered list of IconEntry."""
+                     min_size=None, sort_key=None, sort=True):
+        """Return filtered list of IconEntry.
+
+        With sort=False the entries are left in load order, for callers
+        that only need the count.
+        """
         if themes is None:
             themes = set()
 
         results = []
         query_terms = query.lower().split() if query else []
-
-        for key, entry in self._entries.items():
-            theme_id = key[0]
-
+        shown_statuses = {status for status, shown in (
+            ("hinted", show_hinted),
+            ("duplicate", show_duplicates),
+            ("pending", show_unhinted),
+        ) if shown}
+        filter_status = shown_statuses != _ALL_STATUSES
+
+        # Unselected themes are skipped whole rather than entry by entry;
+        # theme load order is kept so sort ties stay in a stable order
+        for theme_id, theme_entries in self._by_theme.items():
             if theme_id not in themes:
                 continue
 
-            # Size filter
-            if min_size and entry.paths:
-                if max(entry.paths.keys()) < min_size:
-                    continue
+            for entry in theme_entries:
+                # Size filter
+                if min_size and entry.max_size:
+                    if entry.max_size < min_size:
+                        continue
 
-            # Status filter
-            if entry.status == "hinted" and not show_hinted:
-                continue
-            if entry.status == "duplicate" and not show_duplicates:
-                continue
-            if entry.status == "pending" and not show_unhinted:
-                continue
-
-            # Search filter
-            if query_terms:
-                search_text = (
-                    f"{entry.name} {entry.id} {' '.join(entry.hints)} "
-                    f"{entry.source} {entry.category}"
-                ).lower()
-                if not all(t in search_text for t in query_terms):
+                # Status filter
+                if filter_status and entry.status not in shown_statuses:
                     continue
 
-            results.append(entry)
+                # Search filter
+                if query_terms:
+                    search_text = entry.search_text
+                    if not all(t in search_text for t in query_terms):
+                        continue
+
+                results.append(entry)
 
+        if not sort:
+            return results
         if sort_key:
             results.sort(key=sort_key)
         else:
-            results.sort(key=lambda e: (e.source, e.name.lower()))
+            results.sort(key=attrgetter("default_sort"))
         return results
 
-    def get_bitmap(self, entry, size):
-        """Get a wx.Bitmap for the given entry at the given size."""
-        cache_key = (id(entry), size)
-        if cache_key in self._bitmap_cache:
-            return self._bitmap_cache[cache_key]
+    def get_bitmap(self, entry, size, wait=True):
+        """Get a wx.Bitmap for the given entry at the given size.
 
+        Cached by file and size, so entries sharing a file (duplicates)
+        share one decoded bitmap. With wait=False an uncached SVG is
+        rendered on a worker thread instead: wx.NullBitmap is returned
+        for now and on_bitmaps_ready is called once it is in the cache.
+        """
+        cache_key = self._bitmap_key(entry, size)
+        if cache_key is None:
+            return wx.NullBitmap
+        path_str = cache_key[0]
+        bitmap = self._bitmap_cache.get(cache_key)
+        if bitmap is not None:
+            self._bitmap_cache.move_to_end(cache_key)
+            return bitmap
+
+        if not wait and path_str.endswith((".svg", ".svgz")):
+            if cache_key not in self._svg_pending:
+                self._svg_pending.add(cache_key)
+                generation = self._cache_generation
+                future = self._svg_executor.submit(self._render_svg, path_str, size)
+                future.add_done_callback(lambda f: wx.CallAfter(
+                    self._on_svg_rendered, cache_key, generation, f))
+            return wx.NullBitmap
+
+        bitmap = self._load_bitmap(path_str, size)
+        self._cache_bitmap(cache_key, bitmap)
+        return bitmap
+
+    def _bitmap_key(self, entry, size):
+        """Cache key (path_str, size) of entry's bitmap, or None without files."""
         # Find best available size
         path_str = entry.paths.get(size)
         if not path_str:
             available = sorted(entry.paths.keys())
             if not available:
-                return wx.NullBitmap
+                return None
             nearest = min(available, key=lambda s: abs(s - size))
             path_str = entry.paths[nearest]
+        return (path_str, size)
 
-        bitmap = self._load_bitmap(path_str, size)
-        self._bitmap_cache[cache_key] = bitmap
-        return bitmap
+    def pending_key(self, entry, size):
+        """Cache key of entry's bitmap if it is still rendering, else None."""
+        cache_key = self._bitmap_key(entry, size)
+        return cache_key if cache_key in self._svg_pending else None
 
-    def _load_bitmap(self, path_str, target_size):
-        """Load a bitmap from a file path (PNG or SVG)."""
+    def _cache_bitmap(self, cache_key, bitmap):
+        """Add a bitmap to the cache, dropping the least recently used."""
+        self._bitmap_cache[cache_key] = bitmap
+        if len(self._bitmap_cache) > BITMAP_CACHE_MAX:
+            self._bitmap_cache.popitem(last=False)
+
+    def _on_svg_rendered(self, cache_key, generation, future):
+        """Cache a background SVG render (runs on the UI thread)."""
+        if generation != self._cache_generation:
+            return  # cache was cleared while rendering
+        self._svg_pending.discard(cache_key)
+        try:
+            png_data = future.result()
+        except Exception:
+            bitmap = wx.NullBitmap
+        else:
+            bitmap = self._load_bitmap(*cache_key, png_data=png_data)
+        self._cache_bitmap(cache_key, bitmap)
+        if self.on_bitmaps_ready:
+            self.on_bitmaps_ready(cache_key)
+
+    def _render_svg(self, path_str, size):
+        """Render an SVG to PNG bytes at size x size. Safe to call off the UI thread.
+
+        The parsed document is cached, so a size change only re-rasterizes.
+        cairosvg annotates the tree while drawing, so each tree has a lock
+        and renders of the same file take turns.
+        """
+        with self._svg_trees_lock:
+            cached = self._svg_trees.get(path_str)
+            if cached is not None:
+                self._svg_trees.move_to_end(path_str)
+        if cached is None:
+            tree = SvgTree(url=str(path_str))
+            with self._svg_trees_lock:
+                cached = self._svg_trees.setdefault(path_str, (tree, threading.Lock()))
+                if len(self._svg_trees) > SVG_TREE_CACHE_MAX:
+                    self._svg_trees.popitem(last=False)
+        tree, tree_lock = cached
+
+        output = io.BytesIO()
+        with tree_lock:
+            PNGSurface(tree, output, 96,
+                       output_width=size, output_height=size).finish()
+        return output.getvalue()
+
+    def _load_bitmap(self, path_str, target_size, png_data=None):
+        """Load a bitmap from a file path (PNG or SVG).
+
+        png_data is an SVG already rendered by _render_svg.
+        """
         try:
-            if path_str.endswith((".svg", ".svgz")):
-                png_data = cairosvg.svg2png(
-                    url=str(path_str),
-                    output_width=target_size,
-                    output_height=target_size,
-                )
+            if png_data is None and path_str.endswith((".svg", ".svgz")):
+                png_data = self._render_svg(path_str, target_size)
+            if png_data is not None:
                 stream = io.BytesIO(png_data)
                 image = wx.Image(stream)
             else:
@@ -243,8 +392,15 @@ class IconDataModel:
             if not image.IsOk():
                 return wx.NullBitmap
 
-            if image.GetWidth() != target_size or image.GetHeight() != target_size:
-                image.Rescale(target_size, target_size, wx.IMAGE_QUALITY_HIGH)
+            # SVGs are rendered at target size; PNGs from the nearest size
+            # only need the slow high-quality filter for large reductions
+            width, height = image.GetWidth(), image.GetHeight()
+            if width != target_size or height != target_size:
+                if max(width, height) > target_size * 2:
+                    quality = wx.IMAGE_QUALITY_HIGH
+                else:
+                    quality = wx.IMAGE_QUALITY_BILINEAR
+                image.Rescale(target_size, target_size, quality)
 
             return image.ConvertToBitmap()
         except Exception:
@@ -253,6 +409,14 @@ class IconDataModel:
     def clear_cache(self):
         """Clear the bitmap cache (e.g., on size change)."""
         self._bitmap_cache.clear()
+        self._svg_pending.clear()  # in-flight renders are stale; allow resubmits
+        self._cache_generation += 1
+
+    def shutdown(self):
+        """Stop background rendering; queued renders are cancelled."""
+        self.on_bitmaps_ready = None
+        self.clear_cache()  # renders still running land as stale and are dropped
+        self._svg_executor.shutdown(wait=False, cancel_futures=True)
 
 
 # ============================================================================
@@ -267,6 +431,7 @@ COLOR_HOVER = wx.Colour(33, 150, 243)        # blue highlight
 
 CELL_PADDING = 8
 TEXT_HEIGHT = 30  # space for 2 lines of text below icon
+TEXT_CACHE_MAX = 4096  # truncated-label measurements kept by IconGridPanel
 
 
 def _status_border_color(entry):
@@ -283,7 +448,8 @@ class IconGridPanel(wx.ScrolledWindow):
     """Scrollable grid of icon cells with custom painting."""
 
     # Pre-created drawing resources (class-level, initialized once after wx.App)
-    _BUFFER_MAX_HEIGHT = 30000
+    _TILE_HEIGHT = 2048    # virtual rows per pre-rendered tile
+    _SPARE_TILES = 1       # tiles kept beyond those a full view can touch
     _draw_resources = None
 
     @classmethod
@@ -311,6 +477,17 @@ class IconGridPanel(wx.ScrolledWindow):
             "pen_ext": wx.Pen(COLOR_EXTERNAL, 2),
             "pen_ext_dim": wx.Pen(wx.Colour(200, 200, 200), 1),
         }
+        res = cls._draw_resources
+        res["brush_bg_light"] = wx.Brush(res["bg_light"])
+        res["brush_bg_dark"] = wx.Brush(res["bg_dark"])
+        res["brush_cell_light"] = wx.Brush(res["cell_bg_light"])
+        res["brush_cell_dark"] = wx.Brush(res["cell_bg_dark"])
+        # Status -> pen lookup
+        res["status_pens"] = {
+            "hinted": res["pen_hinted"],
+            "duplicate": res["pen_dup"],
+            "pending": res["pen_ext"],
+        }
 
     def __init__(self, parent, model):
         super().__init__(parent, style=wx.VSCROLL | wx.WANTS_CHARS)
@@ -323,9 +500,11 @@ class IconGridPanel(wx.ScrolledWindow):
         self._hover_index = -1
         self._pinned = False
         self._pinned_index = -1
-        self._popup = None
-        self._text_cache = {}  # (entry_id, max_tw) -> (truncated_name, tw, th)
-        self._buffer = None    # off-screen bitmap for smooth scrolling
+        self._popup = None  # one IconDetailPopup, created on first use and reused
+        self._text_cache = OrderedDict()  # (name, max_tw) -> (truncated_name, tw, th), LRU
+        self._tiles = OrderedDict()  # tile index -> (wx.Bitmap, pending keys), LRU
+        self._landed_keys = set()  # renders landed since the last tile refresh
+        model.on_bitmaps_ready = self._on_bitmaps_ready
 
         self.SetScrollRate(0, 20)
         self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
@@ -355,10 +534,9 @@ class IconGridPanel(wx.ScrolledWindow):
         self._hover_index = -1
         self._pinned = False
         self._pinned_index = -1
-        self._text_cache.clear()
-        self._destroy_popup()
+        self._hide_popup()
         self._update_virtual_size()
-        self._rebuild_buffer()
+        self._reset_tiles()
         self.Scroll(0, 0)
         self.Refresh()
 
@@ -366,21 +544,20 @@ class IconGridPanel(wx.ScrolledWindow):
         if size != self._display_size:
             self._display_size = size
             self._model.clear_cache()
-            self._text_cache.clear()
             self._update_virtual_size()
-            self._rebuild_buffer()
+            self._reset_tiles()
             self.Refresh()
 
     def set_dark_bg(self, dark):
         self._dark_bg = dark
-        self._rebuild_buffer()
+        self._reset_tiles()
         self.Refresh()
 
     def set_hover_enabled(self, enabled):
         self._hover_enabled = enabled
         if not enabled and not self._pinned:
             self._hover_index = -1
-            self._destroy_popup()
+            self._hide_popup()
             self.Refresh()
 
     def _update_virtual_size(self):
@@ -410,210 +587,206 @@ class IconGridPanel(wx.ScrolledWindow):
         y = row * self.cell_height
         return wx.Rect(x, y, self.cell_width, self.cell_height)
 
-    def _get_truncated_text(self, dc, entry_id, name, max_tw):
-        """Get truncated name and extents, cached per entry+width."""
-        cache_key = (entry_id, max_tw)
-        if cache_key in self._text_cache:
-            return self._text_cache[cache_key]
+    def _get_truncated_text(self, dc, name, max_tw):
+        """Get truncated name and extents, cached per name+width.
+
+        Keyed by the text rather than the entry, so entries sharing a
+        label share one measurement. The name font is the only one used.
+        """
+        cache_key = (name, max_tw)
+        cached = self._text_cache.get(cache_key)
+        if cached is not None:
+            self._text_cache.move_to_end(cache_key)
+            return cached
         tw, th = dc.GetTextExtent(name)
         if tw > max_tw:
+            # Longest prefix that fits, from one call's cumulative widths
+            widths = dc.GetPartialTextExtents(name)
+            name = name[:max(1, bisect.bisect_right(widths, max_tw))]
+            tw, th = dc.GetTextExtent(name)
+            # Kerning can make the prefix a little wider than its partial sum
             while tw > max_tw and len(name) > 1:
                 name = name[:-1]
                 tw, th = dc.GetTextExtent(name)
         self._text_cache[cache_key] = (name, tw, th)
+        if len(self._text_cache) > TEXT_CACHE_MAX:
+            self._text_cache.popitem(last=False)
         return name, tw, th
 
-    def _rebuild_buffer(self):
-        """Pre-render all cells to an off-screen bitmap for smooth scrolling."""
+    def _reset_tiles(self):
+        """Drop the pre-rendered tiles; they are redrawn as they come into view."""
+        self._tiles.clear()
+
+    def _get_tile(self, k):
+        """Get tile k (virtual y from k * _TILE_HEIGHT), rendering it if needed."""
+        tile = self._tiles.get(k)
+        if tile is not None:
+            self._tiles.move_to_end(k)
+            return tile[0]
+        tile = self._tiles[k] = self._render_tile(k)
+        # Keep only what one view can span (it may straddle two tile
+        # edges) plus a spare, so memory stays flat however long the grid
+        max_tiles = self.GetClientSize().height // self._TILE_HEIGHT + 2 + self._SPARE_TILES
+        while len(self._tiles) > max_tiles:
+            self._tiles.popitem(last=False)
+        return tile[0]
+
+    def _render_tile(self, k):
+        """Pre-render the cells overlapping tile k to an off-screen bitmap.
+
+        Returns (bitmap, pending) where pending holds the cache keys of
+        icons still rendering in the background, drawn blank for now.
+        """
         entries = self._entries
-        client_w = self.GetClientSize().width
-        if not entries or client_w < 1:
-            self._buffer = None
-            return
-
         cols = self.cols
         cw = self.cell_width
         ch = self.cell_height
         ds = self._display_size
-        rows = (len(entries) + cols - 1) // cols
-        buf_w = max(client_w, cols * cw)
-        buf_h = rows * ch + 20
+        tile_h = self._TILE_HEIGHT
+        top = k * tile_h
+        buf_w = max(self.GetClientSize().width, cols * cw)
 
-        if buf_h > self._BUFFER_MAX_HEIGHT:
-            self._buffer = None
-            return
+        # Cells straddling the tile edge are drawn in both tiles, clipped
+        first_idx = (top // ch) * cols
+        last_idx = min(len(entries), ((top + tile_h - 1) // ch + 1) * cols)
 
-        bmp = wx.Bitmap(buf_w, buf_h)
+        bmp = wx.Bitmap(buf_w, tile_h)
         mdc = wx.MemoryDC(bmp)
         res = self._draw_resources
         dark = self._dark_bg
 
-        mdc.SetBackground(wx.Brush(res["bg_dark"] if dark else res["bg_light"]))
+        mdc.SetBackground(res["brush_bg_dark"] if dark else res["brush_bg_light"])
         mdc.Clear()
 
         text_color = res["text_dark"] if dark else res["text_light"]
         sub_color = res["sub_dark"] if dark else res["sub_light"]
-        cell_bg = res["cell_bg_dark"] if dark else res["cell_bg_light"]
-        cell_brush = wx.Brush(cell_bg)
+        cell_brush = res["brush_cell_dark"] if dark else res["brush_cell_light"]
         pen_ext_dim = res["pen_ext_dim"]
-        status_pens = {
-            "hinted": res["pen_hinted"],
-            "duplicate": res["pen_dup"],
-            "pending": res["pen_ext"],
-        }
+        status_pens = res["status_pens"]
 
+        # Brush, name font and colour stay set for the whole first pass
+        mdc.SetBrush(cell_brush)
         mdc.SetFont(res["font_name"])
+        mdc.SetTextForeground(text_color)
         max_tw = cw - 12
-
-        for i, entry in enumerate(entries):
-            row = i // cols
-            col = i % cols
-            rx = col * cw
-            ry = row * ch
-
-            status = entry.status
+        src_lines = []  # (source, cell x, text y), drawn in a second pass
+        pending = set()
+
+        # Cell origins (tile coords) for the tile's entries, row by row,
+        # shared by both passes below
+        col_xs = [col * cw for col in range(cols)]
+        cells = [(entry, rx, ry)
+                 for ry, row_start in zip(range((first_idx // cols) * ch - top, tile_h, ch),
+                                          range(first_idx, last_idx, cols))
+                 for entry, rx in zip(entries[row_start:min(row_start + cols, last_idx)],
+                                      col_xs)]
+
+        # Cell borders first, grouped by status so the pen changes only
+        # once per status rather than once per cell
+        cells_by_status = {}  # status -> [(rx, ry)]
+        for entry, rx, ry in cells:
+            cells_by_status.setdefault(entry.status, []).append((rx, ry))
+        for status, origins in cells_by_status.items():
             if status == "pending":
                 mdc.SetPen(pen_ext_dim)
             else:
                 mdc.SetPen(status_pens.get(status, res["pen_ext"]))
-            mdc.SetBrush(cell_brush)
-            mdc.DrawRoundedRectangle(rx + 5, ry + 5, cw - 10, ch - 10, 3)
+            for rx, ry in origins:
+                mdc.DrawRoundedRectangle(rx + 5, ry + 5, cw - 10, ch - 10, 3)
 
-            bitmap = self._model.get_bitmap(entry, ds)
+        for entry, rx, ry in cells:
+            bitmap = self._model.get_bitmap(entry, ds, wait=False)
             if bitmap.IsOk():
                 mdc.DrawBitmap(bitmap, rx + (cw - ds) // 2, ry + CELL_PADDING, True)
+            else:
+                cache_key = self._model.pending_key(entry, ds)
+                if cache_key is not None:
+                    pending.add(cache_key)
 
-            mdc.SetFont(res["font_name"])
-            mdc.SetTextForeground(text_color)
-            name, tw, th = self._get_truncated_text(
-                mdc, id(entry), entry.name, max_tw)
+            name, tw, th = self._get_truncated_text(mdc, entry.name, max_tw)
             ty = ry + CELL_PADDING + ds + 2
             mdc.DrawText(name, rx + (cw - tw) // 2, ty)
+            src_lines.append((entry.source, rx, ty + th + 1))
 
-            mdc.SetFont(res["font_src"])
-            mdc.SetTextForeground(sub_color)
-            src = entry.source
-            tw2, _ = mdc.GetTextExtent(src)
-            mdc.DrawText(src, rx + (cw - tw2) // 2, ty + th + 1)
-
+        self._draw_source_lines(mdc, src_lines, cw, sub_color)
         mdc.SelectObject(wx.NullBitmap)
-        self._buffer = bmp
+        return bmp, pending
 
     def _on_paint(self, event):
         dc = wx.AutoBufferedPaintDC(self)
         self.DoPrepareDC(dc)
 
-        if self._buffer is not None:
-            res = self._draw_resources
-            dark = self._dark_bg
-            dc.SetBackground(wx.Brush(res["bg_dark"] if dark else res["bg_light"]))
-            dc.Clear()
-            dc.DrawBitmap(self._buffer, 0, 0)
-
-            # Draw hover/pin highlight overlays
-            cols = self.cols
-            cw = self.cell_width
-            ch = self.cell_height
-            pen_hover = res["pen_hover"]
-            for idx in (self._hover_index,
-                        self._pinned_index if self._pinned else -1):
-                if 0 <= idx < len(self._entries):
-                    rx = (idx % cols) * cw
-                    ry = (idx // cols) * ch
-                    dc.SetPen(pen_hover)
-                    dc.SetBrush(wx.TRANSPARENT_BRUSH)
-                    dc.DrawRoundedRectangle(rx + 1, ry + 1, cw - 2, ch - 2, 5)
-        else:
-            self._paint_direct(dc)
+        # Only the damaged area is redrawn: a hover change invalidates just
+        # two cells, so clip to it and blit only the tiles it touches
+        update = self.GetUpdateRegion().GetBox()
+        ux, uy = self.CalcUnscrolledPosition(update.x, update.y)
+        dc.SetClippingRegion(ux, uy, update.width, update.height)
 
-    def _paint_direct(self, dc):
-        """Fallback direct paint when buffer is too large or unavailable."""
         res = self._draw_resources
-
         dark = self._dark_bg
-        dc.SetBackground(wx.Brush(res["bg_dark"] if dark else res["bg_light"]))
+        dc.SetBackground(res["brush_bg_dark"] if dark else res["brush_bg_light"])
         dc.Clear()
 
-        # Calculate visible range
-        view_start = self.GetViewStart()
-        client_h = self.GetClientSize().height
-        scroll_y = view_start[1] * 20
+        entries = self._entries
+        if not entries or self.GetClientSize().width < 1:
+            return
+
+        # Blit the tiles overlapping the damaged rows (virtual coords)
         cols = self.cols
         cw = self.cell_width
         ch = self.cell_height
-        ds = self._display_size
+        tile_h = self._TILE_HEIGHT
+        content_h = (len(entries) + cols - 1) // cols * ch
+        draw_bottom = min(uy + update.height, content_h)
+        for k in range(uy // tile_h, (draw_bottom - 1) // tile_h + 1):
+            dc.DrawBitmap(self._get_tile(k), 0, k * tile_h)
 
-        first_row = max(0, scroll_y // ch)
-        last_row = (scroll_y + client_h) // ch + 1
-        first_idx = first_row * cols
-        last_idx = min(len(self._entries), (last_row + 1) * cols)
-
-        text_color = res["text_dark"] if dark else res["text_light"]
-        sub_color = res["sub_dark"] if dark else res["sub_light"]
-        cell_bg = res["cell_bg_dark"] if dark else res["cell_bg_light"]
-        cell_brush = wx.Brush(cell_bg)
+        # Draw hover/pin highlight overlays
         pen_hover = res["pen_hover"]
-        pen_ext_dim = res["pen_ext_dim"]
-
-        # Status -> pen lookup
-        status_pens = {
-            "hinted": res["pen_hinted"],
-            "duplicate": res["pen_dup"],
-            "pending": res["pen_ext"],
-        }
-
-        # Set name font once, get max_tw
-        dc.SetFont(res["font_name"])
-        max_tw = cw - 12
-
-        hover_idx = self._hover_index
-        pinned = self._pinned
-        pinned_idx = self._pinned_index
-
-        for i in range(first_idx, last_idx):
-            entry = self._entries[i]
-            row = i // cols
-            col = i % cols
-            rx = col * cw
-            ry = row * ch
-            is_highlighted = (i == hover_idx or (pinned and i == pinned_idx))
-
-            dc.SetBrush(cell_brush)
-
-            if is_highlighted:
+        for idx in (self._hover_index,
+                    self._pinned_index if self._pinned else -1):
+            if 0 <= idx < len(entries):
+                rx = (idx % cols) * cw
+                ry = (idx // cols) * ch
                 dc.SetPen(pen_hover)
+                dc.SetBrush(wx.TRANSPARENT_BRUSH)
                 dc.DrawRoundedRectangle(rx + 1, ry + 1, cw - 2, ch - 2, 5)
 
-            status = entry.status
-            if status == "pending" and not is_highlighted:
-                dc.SetPen(pen_ext_dim)
-            else:
-                dc.SetPen(status_pens.get(status, res["pen_ext"]))
-            dc.SetBrush(cell_brush)
-            dc.DrawRoundedRectangle(rx + 5, ry + 5, cw - 10, ch - 10, 3)
-
-            bitmap = self._model.get_bitmap(entry, ds)
-            if bitmap.IsOk():
-                dc.DrawBitmap(bitmap, rx + (cw - ds) // 2, ry + CELL_PADDING, True)
-
-            # Name text (cached truncation)
-            dc.SetFont(res["font_name"])
-            dc.SetTextForeground(text_color)
-            name, tw, th = self._get_truncated_text(
-                dc, id(entry), entry.name, max_tw)
-            ty = ry + CELL_PADDING + ds + 2
-            dc.DrawText(name, rx + (cw - tw) // 2, ty)
-
-            # Source text
-            dc.SetFont(res["font_src"])
-            dc.SetTextForeground(sub_color)
-            src = entry.source
-            tw2, _ = dc.GetTextExtent(src)
-            dc.DrawText(src, rx + (cw - tw2) // 2, ty + th + 1)
+    def _draw_source_lines(self, dc, src_lines, cw, sub_color):
+        """Draw the theme-id line of each cell, with the source font set once."""
+        dc.SetFont(self._draw_resources["font_src"])
+        dc.SetTextForeground(sub_color)
+        src_widths = {}  # a handful of theme ids, each measured once
+        for src, rx, y in src_lines:
+            tw = src_widths.get(src)
+            if tw is None:
+                tw = src_widths[src] = dc.GetTextExtent(src)[0]
+            dc.DrawText(src, rx + (cw - tw) // 2, y)
+
+    def _on_bitmaps_ready(self, cache_key):
+        """Redraw once background-rendered icons have landed (batched)."""
+        if not self._landed_keys:
+            wx.CallLater(50, self._redraw_bitmaps)
+        self._landed_keys.add(cache_key)
+
+    def _redraw_bitmaps(self):
+        """Re-render only the tiles waiting on one of the landed icons."""
+        landed = self._landed_keys
+        self._landed_keys = set()
+        tile_h = self._TILE_HEIGHT
+        width = self.GetClientSize().width
+        for k, (_bmp, pending) in list(self._tiles.items()):
+            if not pending.isdisjoint(landed):
+                del self._tiles[k]
+                _cx, cy = self.CalcScrolledPosition(0, k * tile_h)
+                self.RefreshRect(wx.Rect(0, cy, width, tile_h))
+        popup = self._popup
+        if popup and popup.IsShown() and not popup.pending_keys.isdisjoint(landed):
+            popup.refresh_previews()
 
     def _on_size(self, event):
         self._update_virtual_size()
-        self._rebuild_buffer()
+        self._reset_tiles()
         self.Refresh()
         event.Skip()
 
@@ -643,7 +816,7 @@ class IconGridPanel(wx.ScrolledWindow):
             if idx >= 0:
                 self._show_hover_popup(idx)
             else:
-                self._destroy_popup()
+                self._hide_popup()
         event.Skip()
 
     def _on_leave(self, event):
@@ -662,7 +835,7 @@ class IconGridPanel(wx.ScrolledWindow):
                 event.Skip()
                 return
         self._hover_index = -1
-        self._destroy_popup()
+        self._hide_popup()
         self.Refresh()
         event.Skip()
 
@@ -675,7 +848,7 @@ class IconGridPanel(wx.ScrolledWindow):
         else:
             self._pinned = False
             self._pinned_index = -1
-            self._destroy_popup()
+            self._hide_popup()
         self.SetFocus()
         event.Skip()
 
@@ -690,12 +863,12 @@ class IconGridPanel(wx.ScrolledWindow):
         self._pinned = False
         self._pinned_index = -1
         self._hover_index = -1
-        self._destroy_popup()
+        self._hide_popup()
         self.Refresh()
 
     def _show_hover_popup(self, index):
         """Show popup offset 2 cells from the hovered icon to allow scrolling."""
-        self._destroy_popup()
+        self._hide_popup()
         if index < 0 or index >= len(self._entries):
             return
         entry = self._entries[index]
@@ -707,7 +880,7 @@ class IconGridPanel(wx.ScrolledWindow):
         screen_pos = self.ClientToScreen(wx.Point(cell_right_x, cell_top_y))
         offset_x = self.cell_width * 2
 
-        self._popup = IconDetailPopup(self, self._model, entry)
+        self._fill_popup(entry)
         popup_size = self._popup.GetSize()
         display_idx = wx.Display.GetFromPoint(screen_pos)
         if display_idx == wx.NOT_FOUND:
@@ -728,13 +901,13 @@ class IconGridPanel(wx.ScrolledWindow):
 
     def _show_click_popup(self, index, pos):
         """Show popup at the click cursor position."""
-        self._destroy_popup()
+        self._hide_popup()
         if index < 0 or index >= len(self._entries):
             return
         entry = self._entries[index]
         screen_pos = self.ClientToScreen(pos)
 
-        self._popup = IconDetailPopup(self, self._model, entry)
+        self._fill_popup(entry)
         popup_size = self._popup.GetSize()
         display_idx = wx.Display.GetFromPoint(screen_pos)
         if display_idx == wx.NOT_FOUND:
@@ -752,155 +925,98 @@ class IconGridPanel(wx.ScrolledWindow):
         self._popup.SetPosition(wx.Point(x, y))
         self._popup.Show()
 
-    def _destroy_popup(self):
+    def _fill_popup(self, entry):
+        """Create the shared popup on first use and fill it with entry."""
+        if self._popup is None:
+            self._popup = IconDetailPopup(self, self._model)
+        self._popup.set_entry(entry)
+
+    def _hide_popup(self):
         if self._popup:
-            self._popup.Destroy()
-            self._popup = None
+            self._popup.Hide()
 
 
 class IconDetailPopup(wx.Frame):
-    """Hover/pinned popup showing icon details and metadata."""
+    """Hover/pinned popup showing icon details and metadata.
+
+    One instance is reused for every icon: set_entry() refills its
+    controls in place and shows or hides the optional rows, instead of
+    building a new window per hovered cell.
+    """
 
     BORDER_WIDTH = 3
 
-    def __init__(self, parent, model, entry):
+    def __init__(self, parent, model):
         super().__init__(parent.GetTopLevelParent(), title="",
                          style=wx.FRAME_TOOL_WINDOW | wx.FRAME_FLOAT_ON_PARENT
                          | wx.FRAME_NO_TASKBAR | wx.BORDER_NONE)
         self._grid_panel = parent
+        self._model = model
+        self._entry = None
+        self._paths_text = ""
+        self.pending_keys = set()  # previews still rendering in the background
         self.Bind(wx.EVT_CHAR_HOOK, self._on_char_hook)
 
-        border = wx.Panel(self)
-        border.SetBackgroundColour(_status_border_color(entry))
+        self._border = border = wx.Panel(self)
 
-        panel = wx.Panel(border)
+        self._panel = panel = wx.Panel(border)
         panel.SetBackgroundColour(wx.Colour(255, 255, 245))
-        sizer = wx.BoxSizer(wx.VERTICAL)
-        text_ctrls = []  # collect single-line TextCtrls for auto-width
-
-        # --- Header ---
+        self._sizer = sizer = wx.BoxSizer(wx.VERTICAL)
+        small_font = wx.Font(8, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
+                             wx.FONTWEIGHT_NORMAL)
+
+        def add_text_row(font, flags=wx.EXPAND | wx.LEFT | wx.RIGHT, colour=None):
+            ctrl = wx.TextCtrl(panel, style=wx.TE_READONLY | wx.BORDER_NONE)
+            ctrl.SetBackgroundColour(panel.GetBackgroundColour())
+            ctrl.SetFont(font)
+            if colour is not None:
+                ctrl.SetForegroundColour(colour)
+            sizer.Add(ctrl, 0, flags, 5)
+            return ctrl
+
+        # --- Header, info line, file / sizes ---
         header_font = wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
                               wx.FONTWEIGHT_BOLD)
-        name_label = wx.TextCtrl(panel, value=f'"{entry.name}" ({entry.id})',
-                                  style=wx.TE_READONLY | wx.BORDER_NONE)
-        name_label.SetBackgroundColour(panel.GetBackgroundColour())
-        name_label.SetFont(header_font)
-        text_ctrls.append(name_label)
-        sizer.Add(name_label, 0, wx.EXPAND | wx.ALL, 5)
-
-        # --- Info line ---
-        info_parts = [f"Theme: {entry.source}", f"Status: {entry.status}"]
-        if entry.category:
-            info_parts.append(f"Context: {entry.category}")
-        info_label = wx.TextCtrl(panel, value="  |  ".join(info_parts),
-                                  style=wx.TE_READONLY | wx.BORDER_NONE)
-        info_label.SetBackgroundColour(panel.GetBackgroundColour())
-        info_label.SetFont(wx.Font(8, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
-                                   wx.FONTWEIGHT_NORMAL))
-        text_ctrls.append(info_label)
-        sizer.Add(info_label, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 5)
-
-        # --- File / sizes ---
-        sizes_str = ", ".join(str(s) for s in sorted(entry.paths.keys()))
-        file_info = f"File: {entry.file}"
-        if sizes_str:
-            file_info += f"  |  Sizes: {sizes_str}"
-        file_label = wx.TextCtrl(panel, value=file_info,
-                                  style=wx.TE_READONLY | wx.BORDER_NONE)
-        file_label.SetBackgroundColour(panel.GetBackgroundColour())
-        file_label.SetFont(wx.Font(8, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
-                                   wx.FONTWEIGHT_NORMAL))
-        text_ctrls.append(file_label)
-        sizer.Add(file_label, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 5)
-
-        # --- Duplicate info ---
-        if entry.duplicate_of:
-            dup_label = wx.TextCtrl(panel, value=f"Duplicate of: {entry.duplicate_of}",
-                                    style=wx.TE_READONLY | wx.BORDER_NONE)
-            dup_label.SetBackgroundColour(panel.GetBackgroundColour())
-            dup_label.SetFont(wx.Font(8, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
-                                      wx.FONTWEIGHT_NORMAL))
-            dup_label.SetForegroundColour(wx.Colour(150, 80, 80))
-            text_ctrls.append(dup_label)
-            sizer.Add(dup_label, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 5)
-
-        if entry.duplicates:
-            dups_str = ", ".join(str(d) for d in entry.duplicates)
-            dups_label = wx.TextCtrl(panel, value=f"Duplicates: {dups_str}",
-                                     style=wx.TE_READONLY | wx.BORDER_NONE)
-            dups_label.SetBackgroundColour(panel.GetBackgroundColour())
-            dups_label.SetFont(wx.Font(8, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
-                                       wx.FONTWEIGHT_NORMAL))
-            text_ctrls.append(dups_label)
-            sizer.Add(dups_label, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 5)
-
-        # --- Hints ---
-        if entry.hints:
-            hints_label = wx.TextCtrl(panel,
-                                      value=f"Hints: {', '.join(entry.hints)}",
-                                      style=wx.TE_READONLY | wx.BORDER_NONE)
-            hints_label.SetBackgroundColour(panel.GetBackgroundColour())
-            hints_label.SetFont(wx.Font(8, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
-                                        wx.FONTWEIGHT_NORMAL))
-            hints_label.SetForegroundColour(wx.Colour(40, 120, 40))
-            text_ctrls.append(hints_label)
-            sizer.Add(hints_label, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 5)
-
-        # --- Auto-size popup width to fit longest text line ---
-        max_tw = 0
-        for ctrl in text_ctrls:
-            tw, _ = ctrl.GetTextExtent(ctrl.GetValue())
-            max_tw = max(max_tw, tw)
-        min_width = max_tw + 30  # padding for margins
-        for ctrl in text_ctrls:
-            ctrl.SetMinSize((min_width, -1))
-
-        # --- Size previews ---
-        if entry.paths:
-            size_sizer = wx.BoxSizer(wx.HORIZONTAL)
-            for size in sorted(entry.paths.keys()):
-                bmp = model.get_bitmap(entry, size)
-                if bmp.IsOk():
-                    vbox = wx.BoxSizer(wx.VERTICAL)
-                    sb = wx.StaticBitmap(panel, bitmap=bmp)
-                    vbox.Add(sb, 0, wx.ALIGN_CENTER | wx.ALL, 2)
-                    lbl = wx.StaticText(panel, label=str(size))
-                    lbl.SetFont(wx.Font(7, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
-                                        wx.FONTWEIGHT_NORMAL))
-                    vbox.Add(lbl, 0, wx.ALIGN_CENTER)
-                    size_sizer.Add(vbox, 0, wx.RIGHT, 6)
-            sizer.Add(size_sizer, 0, wx.ALL, 5)
+        self._name_label = add_text_row(header_font, wx.EXPAND | wx.ALL)
+        self._info_label = add_text_row(small_font)
+        self._file_label = add_text_row(small_font)
+
+        # --- Duplicate info and hints (shown only when present) ---
+        self._dup_label = add_text_row(small_font, colour=wx.Colour(150, 80, 80))
+        self._dups_label = add_text_row(small_font)
+        self._hints_label = add_text_row(small_font,
+                                         wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM,
+                                         colour=wx.Colour(40, 120, 40))
+        self._text_ctrls = [self._name_label, self._info_label, self._file_label,
+                            self._dup_label, self._dups_label, self._hints_label]
+
+        # --- Size previews (one slot per size, grown as needed) ---
+        self._preview_font = wx.Font(7, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
+                                     wx.FONTWEIGHT_NORMAL)
+        self._previews = []  # (vbox, StaticBitmap, StaticText)
+        self._size_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        sizer.Add(self._size_sizer, 0, wx.ALL, 5)
 
         # --- File paths ---
-        if entry.paths:
-            sizer.Add(wx.StaticLine(panel), 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 5)
-
-            paths_hdr = wx.BoxSizer(wx.HORIZONTAL)
-            paths_label = wx.StaticText(panel, label="File paths:")
-            paths_label.SetFont(wx.Font(8, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
-                                        wx.FONTWEIGHT_BOLD))
-            paths_hdr.Add(paths_label, 1, wx.ALIGN_CENTER_VERTICAL)
-
-            paths_lines = []
-            for size in sorted(entry.paths.keys()):
-                paths_lines.append(f"{size}: {entry.paths[size]}")
-            paths_text = "\n".join(paths_lines)
-
-            copy_btn = wx.Button(panel, label="Copy", size=(50, 22))
-            copy_btn.Bind(wx.EVT_BUTTON,
-                          lambda e: self._copy_to_clipboard(paths_text))
-            paths_hdr.Add(copy_btn, 0, wx.LEFT, 5)
-            sizer.Add(paths_hdr, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, 5)
-
-            n_lines = len(paths_lines)
-            paths_ctrl = wx.TextCtrl(
-                panel, value=paths_text,
-                style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_DONTWRAP,
-                size=(500, min(20 + n_lines * 16, 120)),
-            )
-            paths_ctrl.SetFont(wx.Font(8, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL,
-                                       wx.FONTWEIGHT_NORMAL))
-            sizer.Add(paths_ctrl, 0, wx.ALL | wx.EXPAND, 5)
+        self._paths_line = wx.StaticLine(panel)
+        sizer.Add(self._paths_line, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 5)
+
+        self._paths_hdr = paths_hdr = wx.BoxSizer(wx.HORIZONTAL)
+        paths_label = wx.StaticText(panel, label="File paths:")
+        paths_label.SetFont(wx.Font(8, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL,
+                                    wx.FONTWEIGHT_BOLD))
+        paths_hdr.Add(paths_label, 1, wx.ALIGN_CENTER_VERTICAL)
+        copy_btn = wx.Button(panel, label="Copy", size=(50, 22))
+        copy_btn.Bind(wx.EVT_BUTTON,
+                      lambda e: self._copy_to_clipboard(self._paths_text))
+        paths_hdr.Add(copy_btn, 0, wx.LEFT, 5)
+        sizer.Add(paths_hdr, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, 5)
+
+        self._paths_ctrl = wx.TextCtrl(
+            panel, style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_DONTWRAP)
+        self._paths_ctrl.SetFont(wx.Font(8, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL,
+                                         wx.FONTWEIGHT_NORMAL))
+        sizer.Add(self._paths_ctrl, 0, wx.ALL | wx.EXPAND, 5)
 
         panel.SetSizer(sizer)
 
@@ -909,12 +1025,95 @@ class IconDetailPopup(wx.Frame):
         border_sizer.Add(panel, 1, wx.ALL | wx.EXPAND, bw)
         border.SetSizer(border_sizer)
 
-        sizer.Fit(panel)
-        border_sizer.Fit(border)
-
         outer_sizer = wx.BoxSizer(wx.VERTICAL)
         outer_sizer.Add(border, 1, wx.EXPAND)
-        self.SetSizerAndFit(outer_sizer)
+        self.SetSizer(outer_sizer)
+
+    def set_entry(self, entry):
+        """Fill the popup with entry's details and fit it to them."""
+        self._entry = entry
+        sizer = self._sizer
+        self._border.SetBackgroundColour(_status_border_color(entry))
+
+        self._name_label.SetValue(f'"{entry.name}" ({entry.id})')
+        info_parts = [f"Theme: {entry.source}", f"Status: {entry.status}"]
+        if entry.category:
+            info_parts.append(f"Context: {entry.category}")
+        self._info_label.SetValue("  |  ".join(info_parts))
+        sizes = sorted(entry.paths.keys())
+        file_info = f"File: {entry.file}"
+        if sizes:
+            file_info += f"  |  Sizes: {', '.join(str(s) for s in sizes)}"
+        self._file_label.SetValue(file_info)
+
+        optional_rows = (
+            (self._dup_label, f"Duplicate of: {entry.duplicate_of}"
+             if entry.duplicate_of else ""),
+            (self._dups_label, "Duplicates: " + ", ".join(str(d) for d in entry.duplicates)
+             if entry.duplicates else ""),
+            (self._hints_label, f"Hints: {', '.join(entry.hints)}"
+             if entry.hints else ""),
+        )
+        for ctrl, value in optional_rows:
+            ctrl.SetValue(value)
+            sizer.Show(ctrl, bool(value))
+
+        # --- Auto-size popup width to fit longest text line ---
+        max_tw = max(ctrl.GetTextExtent(ctrl.GetValue())[0]
+                     for ctrl in self._text_ctrls if ctrl.GetValue())
+        min_width = max_tw + 30  # padding for margins
+        for ctrl in self._text_ctrls:
+            ctrl.SetMinSize((min_width, -1))
+
+        paths_lines = [f"{size}: {entry.paths[size]}" for size in sizes]
+        self._paths_text = "\n".join(paths_lines)
+        self._paths_ctrl.SetValue(self._paths_text)
+        self._paths_ctrl.SetMinSize((500, min(20 + len(paths_lines) * 16, 120)))
+        for item in (self._size_sizer, self._paths_line, self._paths_hdr,
+                     self._paths_ctrl):
+            sizer.Show(item, bool(sizes))
+
+        self.refresh_previews()
+
+    def refresh_previews(self):
+        """Fill the size previews from the bitmap cache and refit.
+
+        SVGs not rendered yet are requested in the background and their
+        cache keys kept in pending_keys; call this again once they land.
+        """
+        entry = self._entry
+        model = self._model
+        shown = []
+        self.pending_keys = set()
+        for size in sorted(entry.paths.keys()):
+            bmp = model.get_bitmap(entry, size, wait=False)
+            if bmp.IsOk():
+                shown.append((size, bmp))
+            else:
+                cache_key = model.pending_key(entry, size)
+                if cache_key is not None:
+                    self.pending_keys.add(cache_key)
+
+        while len(self._previews) < len(shown):
+            vbox = wx.BoxSizer(wx.VERTICAL)
+            sb = wx.StaticBitmap(self._panel)
+            vbox.Add(sb, 0, wx.ALIGN_CENTER | wx.ALL, 2)
+            lbl = wx.StaticText(self._panel)
+            lbl.SetFont(self._preview_font)
+            vbox.Add(lbl, 0, wx.ALIGN_CENTER)
+            self._size_sizer.Add(vbox, 0, wx.RIGHT, 6)
+            self._previews.append((vbox, sb, lbl))
+        for i, (vbox, sb, lbl) in enumerate(self._previews):
+            if i < len(shown):
+                size, bmp = shown[i]
+                sb.SetBitmap(bmp)
+                lbl.SetLabel(str(size))
+            self._size_sizer.Show(vbox, i < len(shown))
+
+        self._sizer.Fit(self._panel)
+        self._border.GetSizer().Fit(self._border)
+        self.Fit()
+        self.Layout()
 
     def _copy_to_clipboard(self, text):
         if wx.TheClipboard.Open():
@@ -1010,10 +1209,11 @@ class ControlsPanel(wx.Panel):
     """Top control bar with filters."""
 
     SORT_CHOICES = ["Icon Name", "Status", "Theme Pack"]
+    # Keys read the lowercased names precomputed on each IconEntry
     SORT_KEYS = {
-        "Theme Pack": lambda e: (e.source, e.name.lower()),
-        "Icon Name": lambda e: e.name.lower(),
-        "Status": lambda e: (e.status, e.source, e.name.lower()),
+        "Theme Pack": attrgetter("default_sort"),
+        "Icon Name": attrgetter("sort_name"),
+        "Status": attrgetter("status", "default_sort"),
     }
 
     def __init__(self, parent, model, on_filter_changed):
@@ -1158,8 +1358,7 @@ class ControlsPanel(wx.Panel):
         self._on_filter_changed()
 
     def _on_theme_change(self, event):
-        for theme_id in self._theme_combo.get_checked_ids():
-            self._model.load_theme(theme_id)
+        self._model.load_themes(self._theme_combo.get_checked_ids())
         self.update_size_choices()
         self._on_filter_changed()
 
@@ -1260,9 +1459,10 @@ class IconGridBrowserFrame(wx.Frame):
         ])
         self.SetAcceleratorTable(accel)
 
+        self.Bind(wx.EVT_CLOSE, self._on_close)
+
         # Load themes that are checked by default
-        for theme_id in self._controls.selected_themes:
-            self._model.load_theme(theme_id)
+        self._model.load_themes(self._controls.selected_themes)
 
         # Initial filter
         self._on_filter_changed()
@@ -1270,6 +1470,10 @@ class IconGridBrowserFrame(wx.Frame):
     def _on_escape(self, event):
         self._grid.unpin()
 
+    def _on_close(self, event):
+        self._model.shutdown()
+        event.Skip()
+
     def _on_filter_changed(self):
         display_size = self._controls.display_size
         sort_key = self._controls.sort_key
@@ -1300,6 +1504,7 @@ class IconGridBrowserFrame(wx.Frame):
             show_duplicates=True,
             show_unhinted=True,
             min_size=display_size,
+            sort=False,
         )
         self._controls.set_count(len(entries), total_filtered, len(all_entries))
 
@@ -10,7 +10,6 @@ Usage:
     python scripts/icon_rebuild_catalog_sizes.py
 """
 
-import json
 import os
 import sys
 
@@ -41,8 +40,7 @@ def main():
 
     # Update catalog
     catalog_path = catalog.catalog_path()
-    with open(catalog_path) as f:
-        catalog_data = json.load(f)
+    catalog_data = catalog.data
 
     updated = False
     for theme_id, sizes in theme_sizes.items():
@@ -13,10 +13,16 @@ import configparser
 import hashlib
 import json
 import os
-import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from json.encoder import encode_basestring_ascii as _encode_json_str
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Path to ICON_THEME_CATALOG.json
 _SCRIPT_DIR = Path(__file__).parent
@@ -26,6 +32,9 @@ _CANON_THEMES_PATH = _SCRIPT_DIR / "ICON_THEME_CATALOG.json"
 # Valid icon file extensions
 ICON_EXTENSIONS = (".svg", ".svgz", ".png")
 
+# Word separators in icon filenames, mapped to space when deriving labels
+SEPARATORS_TO_SPACE = str.maketrans("-_", "  ")
+
 # Sentinel for lazy-loaded properties where None is a valid value
 _SENTINEL = object()
 
@@ -44,20 +53,136 @@ def usage_error(docstring, message=None):
     sys.exit(1)
 
 
+def walk_files(top):
+    """Yield an os.DirEntry for every non-directory entry under top.
+
+    Same entries and top-down order as os.walk, but never descends into
+    symlinked directories and uses the type cached on each DirEntry
+    instead of a separate islink/stat call per name. Like os.walk, a
+    directory that cannot be listed (unreadable, vanished, or a missing
+    top) is skipped silently.
+    """
+    stack = [top]
+    while stack:
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    else:
+                        files.append(entry)
+        except OSError:
+            continue
+        yield from files
+        stack.extend(reversed(subdirs))
+
+
+def _load_json(filepath):
+    """Parse a JSON file, via orjson when installed.
+
+    Anything orjson rejects (e.g. NaN) is re-parsed by the json module so
+    results and errors match json.load.
+    """
+    with open(filepath, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def walk_files_parallel(top):
+    """Return the entries walk_files(top) yields, in the same order.
+
+    Each top-level subdirectory is walked in its own thread: listing a
+    large theme is bound by directory-read latency, and os.scandir
+    releases the GIL while it waits. Unlistable directories are skipped,
+    as in walk_files.
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(top) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    files.append(entry)
+    except OSError:
+        return []
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        for subtree in executor.map(lambda d: list(walk_files(d)), subdirs):
+            files.extend(subtree)
+    return files
+
+
+def _json_scalar(value):
+    """Return json.dumps(value) for a str/number/bool/None."""
+    if type(value) is str:
+        return _encode_json_str(value)
+    return json.dumps(value)
+
+
+def _write_json_compact_arrays(f, data):
+    """Write data to f as json.dumps(data, indent=2) would, but with every
+    array of scalars on a single line.
+
+    Output is written piece by piece as the structure is walked, so the
+    whole document is never held as one string.
+    """
+    write = f.write
+
+    def emit(value, indent):
+        # indent is "\n" plus this value's indentation
+        if isinstance(value, dict):
+            if not value:
+                write("{}")
+                return
+            inner = indent + "  "
+            sep = "{" + inner
+            for key, item in value.items():
+                if type(key) is not str:
+                    key = json.dumps(key)  # int/float/bool/None keys, as json does
+                write(f"{sep}{_encode_json_str(key)}: ")
+                emit(item, inner)
+                sep = "," + inner
+            write(indent + "}")
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                write("[]")
+            elif not any(isinstance(item, (dict, list, tuple)) for item in value):
+                write("[" + ", ".join(map(_json_scalar, value)) + "]")
+            else:
+                inner = indent + "  "
+                sep = "[" + inner
+                for item in value:
+                    write(sep)
+                    emit(item, inner)
+                    sep = "," + inner
+                write(indent + "]")
+        else:
+            write(_json_scalar(value))
+
+    emit(data, "\n")
+    write("\n")
+
+
 def save_json_compact_arrays(filepath, data):
-    """Save JSON with indent=2 but arrays on single lines."""
-    text = json.dumps(data, indent=2)
-    def collapse_array(match):
-        content = match.group(0)
-        collapsed = re.sub(r'\[\s+', '[', content)
-        collapsed = re.sub(r'\s+\]', ']', collapsed)
-        collapsed = re.sub(r',\s+', ', ', collapsed)
-        return collapsed
-    text = re.sub(r'\[\s*\n\s+[^\[\]]*?\s*\]', collapse_array, text)
-    if not text.endswith("\n"):
-        text += "\n"
-    with open(filepath, "w") as f:
-        f.write(text)
+    """Save JSON with indent=2 but arrays on single lines.
+
+    Written to a temporary file and swapped in with os.replace, so an
+    interrupted save never leaves a truncated file behind.
+    """
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "w") as f:
+        _write_json_compact_arrays(f, data)
+    os.replace(tmp_path, filepath)
 
 
 class Theme:
@@ -213,15 +338,13 @@ class Theme:
         """Load icons.json."""
         if not os.path.isfile(self.icons_path):
             fatal_error(f"icons.json not found: {self.icons_path}")
-        with open(self.icons_path) as f:
-            return json.load(f)
+        return _load_json(self.icons_path)
 
     def _load_contexts(self):
         """Load contexts.json. Returns dict or None if file doesn't exist."""
         if not os.path.isfile(self.contexts_path):
             return None
-        with open(self.contexts_path) as f:
-            return json.load(f)
+        return _load_json(self.contexts_path)
 
     # --- Processing methods ---
 
@@ -297,15 +420,9 @@ class Theme:
             base = self.dir
         base_str = str(base)
         exts = ICON_EXTENSIONS
-        all_files = []
-        for dirpath, dirnames, filenames in os.walk(base_str):
-            dirnames[:] = [d for d in dirnames
-                           if not os.path.islink(os.path.join(dirpath, d))]
-            for fn in filenames:
-                if fn.lower().endswith(exts):
-                    full = os.path.join(dirpath, fn)
-                    if not os.path.islink(full):
-                        all_files.append(full)
+        all_files = [entry.path for entry in walk_files_parallel(base_str)
+                     if entry.name.lower().endswith(exts)
+                     and not entry.is_symlink()]
         base = Path(base_str)
 
         discovered = {}
@@ -369,26 +486,21 @@ class Theme:
         stem = Path(filename).stem
         matched = []
         unmatched = []
-        for dirpath, dirnames, filenames in os.walk(self.dir):
-            dirnames[:] = [d for d in dirnames
-                           if not os.path.islink(os.path.join(dirpath, d))]
-            for fn in filenames:
-                fn_stem, ext = os.path.splitext(fn)
-                if fn_stem != stem:
-                    continue
-                full = os.path.join(dirpath, fn)
-                if os.path.islink(full):
-                    continue
-                ext = ext.lower()
-                if ext not in ICON_EXTENSIONS:
-                    fatal_error(f"Unexpected file type '{ext}' for "
-                                f"'{full}' in theme '{self.theme_id}'")
-                rel = self.strip_dir_base(full)
-                dir_part, _ = os.path.split(rel)
-                if self.index and dir_part in self.index:
-                    matched.append(full)
-                else:
-                    unmatched.append(full)
+        for entry in walk_files(self.dir):
+            fn_stem, ext = os.path.splitext(entry.name)
+            if fn_stem != stem or entry.is_symlink():
+                continue
+            full = entry.path
+            ext = ext.lower()
+            if ext not in ICON_EXTENSIONS:
+                fatal_error(f"Unexpected file type '{ext}' for "
+                            f"'{full}' in theme '{self.theme_id}'")
+            rel = self.strip_dir_base(full)
+            dir_part, _ = os.path.split(rel)
+            if self.index and dir_part in self.index:
+                matched.append(full)
+            else:
+                unmatched.append(full)
         return matched, unmatched
 
     def find_icon_files_in_context(self, internal_context_id, filename):
@@ -472,8 +584,7 @@ class ThemeCatalog:
         if not _CANON_THEMES_PATH.is_file():
             fatal_error(f"Theme catalog not found: {_CANON_THEMES_PATH}")
 
-        with open(_CANON_THEMES_PATH) as f:
-            self._raw = json.load(f)
+        self._raw = _load_json(_CANON_THEMES_PATH)
 
         self._themes = {}
         self._skipped = {}
@@ -530,6 +641,11 @@ class ThemeCatalog:
         """Return path to ICON_THEME_CATALOG.json."""
         return self._path
 
+    @property
+    def data(self):
+        """Parsed ICON_THEME_CATALOG.json dict (as loaded, not re-read)."""
+        return self._raw
+
     def print_available(self):
         """Print available/missing themes to stderr."""
         for base_id in sorted(self._raw.keys()):